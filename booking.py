@@ -1,28 +1,54 @@
 from datetime import date, timedelta
 import random
 import string
+from money import from_cents, format_cents
+from days import to_day, to_date
 
 class Booking:
     """Class representing a room booking"""
     
-    def __init__(self, guest, room, check_in, check_out):
+    def __init__(self, guest, room, check_in, check_out, booking_date=None,
+                 room_type=None, rate_cents=None, guest_lookup=None):
         """
         Initialize a Booking object
+        
+        Args:
+            guest: Guest making the booking
+            room: Room being booked, or None to hold a room type and assign a room later
+            check_in: Check-in date
+            check_out: Check-out date
+            booking_date: Date the booking was made (defaults to today)
+            room_type: Room type held when no room is given
+            rate_cents: Nightly rate in cents when no room is given
+            guest_lookup: Callable returning a guest by ID; when given, only the
+                guest ID is kept, so guest profiles can be evicted from memory
         """
+        if room is None and (room_type is None or rate_cents is None):
+            raise ValueError("A booking without a room needs a room type and rate")
         self._booking_id = self._generate_booking_id()
-        self._guest = guest
+        self._booking_day = to_day(booking_date or date.today())
+        self._guest_id = guest.get_guest_id()
+        self._guest_lookup = guest_lookup
+        self._guest = guest if guest_lookup is None else None
         self._room = room
-        self._check_in = check_in
-        self._check_out = check_out
+        self._room_type = room.get_room_type() if room is not None else room_type
+        self._rate_cents = room.get_price_cents() if room is not None else rate_cents
+        # Dates are stored as day ordinals; date objects only exist at the getters
+        self._check_in_day = to_day(check_in)
+        self._check_out_day = to_day(check_out)
         self._status = "Confirmed"
         self._additional_services = []
         
-        # Calculate total cost - FIXED LINE
-        nights = (check_out - check_in).days
-        self._total_cost = room.get_price() * nights  # Changed from room.price to room.get_price()
+        # Charges are kept in integer cents so totals add up exactly
+        self._room_charges_cents = self._rate_cents * self.get_nights()
+        self._service_charges_cents = 0
+        # Charges posted to the folio so far by the night audit
+        self._posted_nights = 0
+        self._posted_service_cents = 0
         
         # Book the room
-        room.book_room(check_in, check_out)
+        if room is not None:
+            room.book_days(self._check_in_day, self._check_out_day)
         
         # Add to guest's reservation history
         guest.add_reservation(self)
@@ -38,19 +64,78 @@ class Booking:
     
     def get_guest(self):
         """Get the guest"""
+        if self._guest_lookup is not None:
+            return self._guest_lookup(self._guest_id)
         return self._guest
     
+    def get_guest_id(self):
+        """Get the ID of the guest"""
+        return self._guest_id
+    
     def get_room(self):
-        """Get the room"""
+        """Get the room (None until a room is assigned)"""
         return self._room
     
+    def get_room_type(self):
+        """Get the room type"""
+        return self._room_type
+    
+    def get_rate_cents(self):
+        """Get the nightly room rate in cents"""
+        return self._rate_cents
+    
+    def get_room_label(self):
+        """Get "<number> (<type>)", or "Unassigned (<type>)" before a room is assigned"""
+        number = self._room.get_room_number() if self._room is not None else "Unassigned"
+        return f"{number} ({self._room_type.get_type_name()})"
+    
+    def assign_room(self, room):
+        """
+        Assign a room to a booking that holds a room type
+        
+        Args:
+            room: Room of the booked type that is free for the stay
+        """
+        if self._room is not None:
+            raise ValueError("Booking already has a room")
+        if room.get_room_type().get_type_name().lower() != self._room_type.get_type_name().lower():
+            raise ValueError("Room is not of the booked type")
+        room.book_days(self._check_in_day, self._check_out_day)
+        self._room = room
+    
+    def unassign_room(self):
+        """Free the assigned room's nights, leaving the booking holding its room type only"""
+        if self._room is not None:
+            self._room.release_days(self._check_in_day, self._check_out_day)
+            self._room = None
+    
     def get_check_in(self):
         """Get the check-in date"""
-        return self._check_in
+        return to_date(self._check_in_day)
     
     def get_check_out(self):
         """Get the check-out date"""
-        return self._check_out
+        return to_date(self._check_out_day)
+    
+    def get_check_in_day(self):
+        """Get the check-in date as a day ordinal"""
+        return self._check_in_day
+    
+    def get_check_out_day(self):
+        """Get the check-out date as a day ordinal"""
+        return self._check_out_day
+    
+    def get_nights(self):
+        """Get the number of nights"""
+        return self._check_out_day - self._check_in_day
+    
+    def get_booking_date(self):
+        """Get the date the booking was made"""
+        return to_date(self._booking_day)
+    
+    def get_booking_day(self):
+        """Get the date the booking was made as a day ordinal"""
+        return self._booking_day
     
     def get_status(self):
         """Get the booking status"""
@@ -65,12 +150,45 @@ class Booking:
     
     def get_total_cost(self):
         """Get the total cost"""
-        return self._total_cost
+        return from_cents(self.get_total_cost_cents())
+    
+    def get_total_cost_cents(self):
+        """Get the total cost in cents"""
+        return self._room_charges_cents + self._service_charges_cents
+    
+    def get_room_charges_cents(self):
+        """Get the room charges in cents"""
+        return self._room_charges_cents
+    
+    def get_service_charges_cents(self):
+        """Get the additional service charges in cents"""
+        return self._service_charges_cents
+    
+    def get_posted_charges_cents(self):
+        """Get the charges posted to the folio by the night audit, in cents"""
+        return self._posted_nights * self._rate_cents + self._posted_service_cents
+    
+    def post_charges(self, through_day):
+        """
+        Post the room nights up to a day, and any services not yet posted, to the folio
+        
+        Args:
+            through_day: Day ordinal of the last night to post
+            
+        Returns:
+            tuple: (room charges, service charges) posted now, in cents
+        """
+        nights = min(through_day + 1, self._check_out_day) - self._check_in_day
+        new_nights = max(nights - self._posted_nights, 0)
+        new_service_cents = self._service_charges_cents - self._posted_service_cents
+        self._posted_nights += new_nights
+        self._posted_service_cents += new_service_cents
+        return new_nights * self._rate_cents, new_service_cents
     
     def add_service(self, service):
         """Add an additional service to the booking"""
         self._additional_services.append(service)
-        self._total_cost += service.get_price()  # Also changed from service.price
+        self._service_charges_cents += service.get_price_cents()
     
     def get_additional_services(self):
         """Get additional services"""
@@ -82,16 +200,17 @@ class Booking:
             return
         
         self._status = "Cancelled"
-        self._room.release_room()
+        if self._room is not None:
+            self._room.release_days(self._check_in_day, self._check_out_day)
+            self._room.release_room()
     
     def __str__(self):
         """String representation of the Booking"""
-        nights = (self._check_out - self._check_in).days
         services = ", ".join([s.get_name() for s in self._additional_services]) or "None"
         return (f"Booking ID: {self._booking_id}\n"
-                f"Guest: {self._guest.get_name()}\n"
-                f"Room: {self._room.get_room_number()} ({self._room.get_room_type().get_type_name()})\n"
-                f"Dates: {self._check_in} to {self._check_out} ({nights} nights)\n"
+                f"Guest: {self.get_guest().get_name()}\n"
+                f"Room: {self.get_room_label()}\n"
+                f"Dates: {self.get_check_in()} to {self.get_check_out()} ({self.get_nights()} nights)\n"
                 f"Status: {self._status}\n"
-                f"Total Cost: ${self._total_cost:.2f}\n"
+                f"Total Cost: ${format_cents(self.get_total_cost_cents())}\n"
                 f"Additional Services: {services}")
\ No newline at end of file
@@ -0,0 +1,21 @@
+from datetime import date
+
+
+def to_day(value):
+    """
+    Convert a date to its integer day ordinal (ints are passed through)
+    
+    Args:
+        value: datetime.date or day ordinal
+    
+    Returns:
+        int: Day ordinal, as returned by date.toordinal()
+    """
+    if isinstance(value, int):
+        return value
+    return value.toordinal()
+
+
+def to_date(day):
+    """Convert an integer day ordinal back to a datetime.date"""
+    return date.fromordinal(day)
\ No newline at end of file
@@ -0,0 +1,152 @@
+import heapq
+import itertools
+import time
+from collections import deque
+
+DEFAULT_DEPARTMENT = "Front Desk"
+# Heaps are rebuilt once stale entries outnumber pending ones and this floor
+COMPACT_MIN_STALE = 64
+
+
+class ServiceDispatcher:
+    """Priority queues of service requests per staff department"""
+    
+    def __init__(self, default_department=DEFAULT_DEPARTMENT, clock=time.time, sample_size=1000):
+        """
+        Initialize a ServiceDispatcher object
+        
+        Args:
+            default_department: Department for services that do not name one
+            clock: Function returning the current time in seconds
+            sample_size: Number of recent fulfillments kept for percentiles
+        """
+        self._default_department = default_department
+        self._clock = clock
+        self._queues = {}
+        self._depths = {}
+        self._requests = {}
+        self._submitted_at = {}
+        self._sequence = itertools.count()
+        self._fulfilled_count = 0
+        self._fulfill_seconds_total = 0.0
+        self._recent_fulfill_seconds = deque(maxlen=sample_size)
+    
+    def get_department(self, request):
+        """Get the department a request is routed to"""
+        return request.get_service().get_department() or self._default_department
+    
+    def submit(self, request):
+        """
+        Queue a pending service request for its department
+        
+        Args:
+            request: ServiceRequest to queue
+        """
+        if request.get_request_id() in self._requests:
+            return
+        department = self.get_department(request)
+        heapq.heappush(self._queues.setdefault(department, []),
+                       (request.get_priority(), next(self._sequence), request))
+        self._depths[department] = self._depths.get(department, 0) + 1
+        self._requests[request.get_request_id()] = request
+        self._submitted_at[request.get_request_id()] = self._clock()
+        request.add_change_listener(self._on_request_changed)
+    
+    def claim(self, staff):
+        """
+        Assign the most urgent pending request of a staff member's department
+        
+        Args:
+            staff: Staff member claiming work
+        
+        Returns:
+            ServiceRequest: The claimed request, or None if the queue is empty
+        """
+        queue = self._queues.get(staff.get_department())
+        while queue:
+            _, _, request = heapq.heappop(queue)
+            # Requests fulfilled or cancelled while queued are dropped lazily here
+            if request.get_status() == "Pending":
+                request.assign_to(staff)
+                return request
+        return None
+    
+    def get_request(self, request_id):
+        """Get a request by ID"""
+        return self._requests.get(request_id)
+    
+    def get_pending(self, department):
+        """
+        Get the pending requests of a department, most urgent first
+        
+        Only pending entries are sorted; stale ones are filtered out first.
+        
+        Args:
+            department: Department name
+        
+        Returns:
+            List[ServiceRequest]: Pending requests
+        """
+        pending = [entry for entry in self._queues.get(department, [])
+                   if entry[2].get_status() == "Pending"]
+        return [request for _, _, request in sorted(pending)]
+    
+    def get_queue_depth(self, department=None):
+        """Get the number of pending requests for a department, or all departments"""
+        if department is None:
+            return sum(self._depths.values())
+        return self._depths.get(department, 0)
+    
+    def get_metrics(self):
+        """
+        Get queue-depth and time-to-fulfill metrics
+        
+        Returns:
+            dict: Queue depth per department, fulfilled count, and the
+            average, p50 and p95 time to fulfill in seconds
+        """
+        samples = sorted(self._recent_fulfill_seconds)
+        
+        def percentile(fraction):
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+        
+        average = self._fulfill_seconds_total / self._fulfilled_count if self._fulfilled_count else 0.0
+        return {
+            "queue_depth": dict(self._depths),
+            "fulfilled": self._fulfilled_count,
+            "avg_time_to_fulfill": average,
+            "p50_time_to_fulfill": percentile(0.50),
+            "p95_time_to_fulfill": percentile(0.95),
+        }
+    
+    def _on_request_changed(self, request, field, old_value, new_value):
+        """Update queue depth and metrics when a request changes status"""
+        if field != "status":
+            return
+        if old_value == "Pending":
+            department = self.get_department(request)
+            self._depths[department] -= 1
+            self._compact(department)
+        if new_value not in ("Fulfilled", "Cancelled"):
+            return
+        # Finished requests are no longer tracked; they live on in the guest's history
+        self._requests.pop(request.get_request_id(), None)
+        request.remove_change_listener(self._on_request_changed)
+        submitted_at = self._submitted_at.pop(request.get_request_id(), None)
+        if new_value == "Fulfilled" and submitted_at is not None:
+            elapsed = self._clock() - submitted_at
+            self._fulfilled_count += 1
+            self._fulfill_seconds_total += elapsed
+            self._recent_fulfill_seconds.append(elapsed)
+    
+    def _compact(self, department):
+        """Rebuild a department's heap without stale entries once they dominate it"""
+        queue = self._queues.get(department)
+        if not queue:
+            return
+        stale = len(queue) - self._depths[department]
+        if stale > COMPACT_MIN_STALE and stale > self._depths[department]:
+            queue[:] = [entry for entry in queue if entry[2].get_status() == "Pending"]
+            heapq.heapify(queue)
\ No newline at end of file
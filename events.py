@@ -0,0 +1,160 @@
+import json
+import time
+
+BOOKING_CREATED = "booking.created"
+BOOKING_SERVICE_ADDED = "booking.service_added"
+BOOKING_CANCELLED = "booking.cancelled"
+BOOKING_ROOM_ASSIGNED = "booking.room_assigned"
+BOOKING_CHARGES_POSTED = "booking.charges_posted"
+BOOKING_COMPLETED = "booking.completed"
+PAYMENT_PROCESSED = "payment.processed"
+ROOM_PRICE_CHANGED = "room.price_changed"
+SERVICE_AVAILABILITY_CHANGED = "service.availability_changed"
+NIGHT_AUDIT_COMPLETED = "night_audit.completed"
+
+EVENT_TYPES = (
+    BOOKING_CREATED,
+    BOOKING_SERVICE_ADDED,
+    BOOKING_CANCELLED,
+    BOOKING_ROOM_ASSIGNED,
+    BOOKING_CHARGES_POSTED,
+    BOOKING_COMPLETED,
+    PAYMENT_PROCESSED,
+    ROOM_PRICE_CHANGED,
+    SERVICE_AVAILABILITY_CHANGED,
+    NIGHT_AUDIT_COMPLETED,
+)
+
+
+class ChangeEvent:
+    """Class representing one change to hotel state"""
+    
+    def __init__(self, sequence, event_type, payload, timestamp=None):
+        """
+        Initialize a ChangeEvent object
+        
+        Args:
+            sequence: Position of the event in the stream, starting at 1
+            event_type: One of EVENT_TYPES
+            payload: JSON-serializable details of the change
+            timestamp: Time of the change in seconds (defaults to now)
+        """
+        self._sequence = sequence
+        self._event_type = event_type
+        self._payload = payload
+        self._timestamp = timestamp if timestamp is not None else time.time()
+    
+    def get_sequence(self):
+        """Get the sequence number"""
+        return self._sequence
+    
+    def get_event_type(self):
+        """Get the event type"""
+        return self._event_type
+    
+    def get_payload(self):
+        """Get the event payload"""
+        return dict(self._payload)
+    
+    def get_timestamp(self):
+        """Get the event timestamp"""
+        return self._timestamp
+    
+    def to_dict(self):
+        """Get the event as a JSON-serializable dict"""
+        return {
+            "sequence": self._sequence,
+            "type": self._event_type,
+            "timestamp": self._timestamp,
+            "payload": self._payload,
+        }
+    
+    def __str__(self):
+        """String representation of the ChangeEvent"""
+        return f"Event #{self._sequence} {self._event_type}: {self._payload}"
+
+
+class EventBus:
+    """Publishes sequence-numbered change events to in-process subscribers"""
+    
+    def __init__(self):
+        """Initialize an EventBus with no subscribers"""
+        self._subscribers = []
+        self._sequence = 0
+    
+    def subscribe(self, callback, event_types=None):
+        """
+        Subscribe to change events
+        
+        Args:
+            callback: Callable taking a ChangeEvent
+            event_types: Event types to receive (defaults to all)
+        """
+        if event_types is not None:
+            unknown = set(event_types) - set(EVENT_TYPES)
+            if unknown:
+                raise ValueError(f"Unknown event types: {', '.join(sorted(unknown))}")
+            event_types = frozenset(event_types)
+        self._subscribers.append((callback, event_types))
+    
+    def unsubscribe(self, callback):
+        """Remove every subscription of a callback"""
+        self._subscribers = [(c, t) for c, t in self._subscribers if c != callback]
+    
+    def get_last_sequence(self):
+        """Get the sequence number of the last published event"""
+        return self._sequence
+    
+    def publish(self, event_type, payload):
+        """
+        Publish an event to all interested subscribers
+        
+        Args:
+            event_type: One of EVENT_TYPES
+            payload: JSON-serializable details of the change
+        
+        Returns:
+            ChangeEvent: The published event
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        self._sequence += 1
+        event = ChangeEvent(self._sequence, event_type, payload)
+        for callback, event_types in list(self._subscribers):
+            if event_types is None or event_type in event_types:
+                callback(event)
+        return event
+
+
+class JsonlEventSink:
+    """Subscriber that appends events to a JSON Lines file in batches"""
+    
+    def __init__(self, path, batch_size=100):
+        """
+        Initialize a JsonlEventSink object
+        
+        Args:
+            path: File to append events to
+            batch_size: Number of events buffered before writing
+        """
+        self._path = path
+        self._batch_size = batch_size
+        self._buffer = []
+    
+    def __call__(self, event):
+        """Buffer an event, writing the batch once it is full"""
+        self._buffer.append(json.dumps(event.to_dict(), default=str))
+        if len(self._buffer) >= self._batch_size:
+            self.flush()
+    
+    def flush(self):
+        """Write all buffered events to the file"""
+        if not self._buffer:
+            return
+        with open(self._path, "a", encoding="utf-8") as sink:
+            sink.write("\n".join(self._buffer) + "\n")
+        self._buffer = []
+    
+    def get_pending_count(self):
+        """Get the number of buffered events not yet written"""
+        return len(self._buffer)
\ No newline at end of file
@@ -0,0 +1,108 @@
+from array import array
+from datetime import date
+from days import to_day
+
+FORECAST_HORIZON_DAYS = 365
+HISTORY_DAYS = 365
+
+
+class OccupancyForecaster:
+    """Occupancy and revenue forecasts by room type from on-the-books bookings"""
+    
+    def __init__(self, horizon=FORECAST_HORIZON_DAYS, history_days=HISTORY_DAYS):
+        """
+        Initialize an OccupancyForecaster object
+        
+        Args:
+            horizon: Number of future days to forecast
+            history_days: Number of past days used to learn pickup and cancellations
+        """
+        self._horizon = horizon
+        self._history_days = history_days
+    
+    def forecast(self, rooms, bookings, today=None):
+        """
+        Forecast rooms sold, occupancy and revenue for every room type and day
+        
+        The forecast for a day is what is on the books, less expected
+        cancellations, plus the pickup typically booked between that lead
+        time and arrival, capped at the number of rooms of the type.
+        
+        Args:
+            rooms: Rooms of the hotel
+            bookings: All bookings, past and future
+            today: Date the forecast is made (defaults to today)
+        
+        Returns:
+            dict: Room type name -> {"capacity", "on_the_books", "rooms",
+            "occupancy", "revenue"}, where each series has one value per day
+            starting today
+        """
+        today = today or date.today()
+        base = to_day(today)
+        horizon, history = self._horizon, self._history_days
+        max_lead = max(horizon, history)
+        
+        capacity, rate_total = {}, {}
+        for room in rooms:
+            type_name = room.get_room_type().get_type_name()
+            capacity[type_name] = capacity.get(type_name, 0) + 1
+            rate_total[type_name] = rate_total.get(type_name, 0) + room.get_price_cents()
+        
+        def zeros(count):
+            return array("l", [0]) * count
+        
+        on_the_books = {t: zeros(horizon) for t in capacity}
+        nights_by_lead = {t: zeros(max_lead + 1) for t in capacity}
+        cancelled_nights = dict.fromkeys(capacity, 0)
+        
+        # One pass over the bookings fills the future on-the-books curve and
+        # the historical nights-by-lead-time histogram of every room type
+        for booking in bookings:
+            type_name = booking.get_room_type().get_type_name()
+            if type_name not in capacity:
+                continue
+            first = booking.get_check_in_day() - base
+            last = booking.get_check_out_day() - base
+            cancelled = booking.get_status() == "Cancelled"
+            booked = booking.get_booking_day() - base
+            
+            if not cancelled and booked <= 0 and last > 0 and first < horizon:
+                otb = on_the_books[type_name]
+                for offset in range(max(first, 0), min(last, horizon)):
+                    otb[offset] += 1
+            
+            if first < 0 and last > -history:
+                past_nights = range(max(first, -history), min(last, 0))
+                if cancelled:
+                    cancelled_nights[type_name] += len(past_nights)
+                    continue
+                histogram = nights_by_lead[type_name]
+                for offset in past_nights:
+                    histogram[min(max(offset - booked, 0), max_lead)] += 1
+        
+        forecasts = {}
+        for type_name, rooms_of_type in capacity.items():
+            histogram = nights_by_lead[type_name]
+            realized = sum(histogram)
+            cancel_rate = cancelled_nights[type_name] / (realized + cancelled_nights[type_name]
+                                                         or 1)
+            # Average rooms per day still to be booked at each lead time
+            pickup = array("d", [0.0]) * (max_lead + 1)
+            booked_later = 0
+            for lead in range(max_lead + 1):
+                pickup[lead] = booked_later / history
+                booked_later += histogram[lead]
+            
+            otb = on_the_books[type_name]
+            sold = array("d", (min(rooms_of_type, otb[day] * (1 - cancel_rate) + pickup[day])
+                               for day in range(horizon)))
+            average_rate = rate_total[type_name] / rooms_of_type / 100
+            forecasts[type_name] = {
+                "capacity": rooms_of_type,
+                "on_the_books": otb,
+                "rooms": sold,
+                "occupancy": array("d", (value / rooms_of_type for value in sold)),
+                "revenue": array("d", (value * average_rate for value in sold)),
+            }
+        return forecasts
\ No newline at end of file
@@ -0,0 +1,159 @@
+from collections import deque
+
+
+def normalize_email(email):
+    """Normalize an email address for lookups (trimmed, lowercase)"""
+    return email.strip().lower()
+
+
+def normalize_contact(contact):
+    """Normalize a phone number for lookups (digits only)"""
+    return "".join(ch for ch in contact if ch.isdigit())
+
+
+def _name_tokens(name):
+    """Split a name into lowercase tokens (first, middle and last names)"""
+    return [token for token in name.strip().lower().split() if token]
+
+
+class _TrieNode:
+    """Node of the name prefix trie"""
+    
+    __slots__ = ("children", "guest_ids")
+    
+    def __init__(self):
+        """Initialize an empty trie node"""
+        self.children = {}
+        # Insertion-ordered, so a limited lookup can stop early instead of sorting
+        self.guest_ids = {}
+
+
+class GuestIndex:
+    """Secondary indexes over guests by email, phone number and name prefix"""
+    
+    def __init__(self):
+        """Initialize empty indexes"""
+        self._by_email = {}
+        self._by_contact = {}
+        self._name_root = _TrieNode()
+        self._indexed_names = {}
+    
+    def add_guest(self, guest):
+        """
+        Index a guest and keep the index up to date when the guest changes
+        
+        Args:
+            guest: Guest to index
+        """
+        guest_id = guest.get_guest_id()
+        self._add_key(self._by_email, normalize_email(guest.get_email()), guest_id)
+        self._add_key(self._by_contact, normalize_contact(guest.get_contact()), guest_id)
+        self._add_name(guest.get_name(), guest_id)
+        self.watch_guest(guest)
+    
+    def watch_guest(self, guest):
+        """Follow changes of an indexed guest, e.g. after it is reloaded from disk"""
+        guest.add_change_listener(self._on_guest_changed)
+    
+    def remove_guest(self, guest):
+        """Remove a guest from all indexes"""
+        guest_id = guest.get_guest_id()
+        self._remove_key(self._by_email, normalize_email(guest.get_email()), guest_id)
+        self._remove_key(self._by_contact, normalize_contact(guest.get_contact()), guest_id)
+        self._remove_name(guest_id)
+        guest.remove_change_listener(self._on_guest_changed)
+    
+    def find_by_email(self, email):
+        """Get the IDs of guests registered with an email address"""
+        return sorted(self._by_email.get(normalize_email(email), ()))
+    
+    def find_by_contact(self, contact):
+        """Get the IDs of guests registered with a phone number"""
+        return sorted(self._by_contact.get(normalize_contact(contact), ()))
+    
+    def find_by_name_prefix(self, prefix, limit=20):
+        """
+        Get the IDs of guests with a name token starting with a prefix
+        
+        Args:
+            prefix: Start of a first, middle or last name (case-insensitive)
+            limit: Maximum number of guest IDs to return
+        
+        Returns:
+            List[str]: Matching guest IDs, at most limit of them, shortest
+            matching name token first, then alphabetically by token, then in
+            the order guests were indexed
+        """
+        node = self._name_root
+        for ch in prefix.strip().lower():
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        
+        # Breadth-first, so shorter tokens are reached before longer ones
+        found = []
+        seen = set()
+        queue = deque([node])
+        while queue and len(found) < limit:
+            current = queue.popleft()
+            for guest_id in current.guest_ids:
+                if guest_id not in seen:
+                    seen.add(guest_id)
+                    found.append(guest_id)
+                    if len(found) >= limit:
+                        break
+            queue.extend(current.children[ch] for ch in sorted(current.children))
+        return found
+    
+    def _on_guest_changed(self, guest, field, old_value, new_value):
+        """Move a guest between index entries after one of its setters ran"""
+        guest_id = guest.get_guest_id()
+        if field == "email":
+            self._remove_key(self._by_email, normalize_email(old_value), guest_id)
+            self._add_key(self._by_email, normalize_email(new_value), guest_id)
+        elif field == "contact":
+            self._remove_key(self._by_contact, normalize_contact(old_value), guest_id)
+            self._add_key(self._by_contact, normalize_contact(new_value), guest_id)
+        elif field == "name":
+            self._remove_name(guest_id)
+            self._add_name(new_value, guest_id)
+    
+    def _add_key(self, index, key, guest_id):
+        """Add a guest ID under a key of a hash index"""
+        if key:
+            index.setdefault(key, set()).add(guest_id)
+    
+    def _remove_key(self, index, key, guest_id):
+        """Remove a guest ID from under a key of a hash index"""
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(guest_id)
+            if not ids:
+                del index[key]
+    
+    def _add_name(self, name, guest_id):
+        """Insert every token of a guest's name into the prefix trie"""
+        tokens = _name_tokens(name)
+        for token in tokens:
+            node = self._name_root
+            for ch in token:
+                node = node.children.setdefault(ch, _TrieNode())
+            node.guest_ids[guest_id] = None
+        self._indexed_names[guest_id] = tokens
+    
+    def _remove_name(self, guest_id):
+        """Remove a guest's name tokens from the prefix trie, pruning empty nodes"""
+        for token in self._indexed_names.pop(guest_id, []):
+            path = [self._name_root]
+            for ch in token:
+                node = path[-1].children.get(ch)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                path[-1].guest_ids.pop(guest_id, None)
+                for depth in range(len(token), 0, -1):
+                    node = path[depth]
+                    if node.guest_ids or node.children:
+                        break
+                    del path[depth - 1].children[token[depth - 1]]
\ No newline at end of file
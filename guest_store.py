@@ -0,0 +1,132 @@
+import shelve
+import weakref
+from collections import OrderedDict
+
+DEFAULT_CACHE_SIZE = 10000
+
+
+class GuestRepository:
+    """Guest profiles kept in a bounded LRU cache in front of an on-disk store"""
+    
+    def __init__(self, path=None, capacity=DEFAULT_CACHE_SIZE, on_load=None):
+        """
+        Initialize a GuestRepository object
+        
+        Args:
+            path: File for the on-disk store; None keeps every guest in memory
+            capacity: Maximum number of guests cached in memory
+            on_load: Callable run on each guest loaded back from disk
+        """
+        self._store = shelve.open(path) if path else None
+        self._capacity = capacity if path else None
+        self._on_load = on_load
+        self._cache = OrderedDict()
+        # Guests still referenced elsewhere (e.g. by a booking) are reused on
+        # load, so there is never more than one object per guest
+        self._live = weakref.WeakValueDictionary()
+        self._count = len(self._store) if self._store is not None else 0
+    
+    def get(self, guest_id, default=None):
+        """
+        Get a guest, loading it from disk if it is not cached
+        
+        Args:
+            guest_id: Guest ID
+            default: Value returned if the guest does not exist
+        
+        Returns:
+            Guest: The guest, or default
+        """
+        guest = self._cache.get(guest_id)
+        if guest is not None:
+            self._cache.move_to_end(guest_id)
+            return guest
+        if self._store is None:
+            return default
+        
+        guest = self._live.get(guest_id)
+        if guest is None:
+            guest = self._store.get(str(guest_id))
+            if guest is None:
+                return default
+            if self._on_load is not None:
+                self._on_load(guest)
+        self._cache_guest(guest_id, guest)
+        return guest
+    
+    def __getitem__(self, guest_id):
+        """Get a guest, raising KeyError if it does not exist"""
+        guest = self.get(guest_id)
+        if guest is None:
+            raise KeyError(guest_id)
+        return guest
+    
+    def __setitem__(self, guest_id, guest):
+        """Add or replace a guest"""
+        if guest_id not in self:
+            self._count += 1
+        self._cache_guest(guest_id, guest)
+    
+    def __contains__(self, guest_id):
+        """Check if a guest exists, in memory or on disk"""
+        if guest_id in self._cache:
+            return True
+        return self._store is not None and str(guest_id) in self._store
+    
+    def keys(self):
+        """Get the IDs of all guests, in memory and on disk"""
+        guest_ids = list(self._cache)
+        if self._store is not None:
+            cached = set(str(guest_id) for guest_id in guest_ids)
+            guest_ids.extend(key for key in self._store.keys() if key not in cached)
+        return guest_ids
+    
+    def iter_stored(self):
+        """Iterate over the guests in the on-disk store, without caching them"""
+        if self._store is None:
+            return
+        for key in self._store.keys():
+            yield self._store[key]
+    
+    def __len__(self):
+        """Number of guests, in memory and on disk"""
+        return self._count
+    
+    def get_cached_count(self):
+        """Get the number of guests currently held in memory"""
+        return len(self._cache)
+    
+    def flush(self):
+        """Write every cached guest, and every evicted guest still in use, back to disk"""
+        if self._store is None:
+            return
+        for guest_id, guest in self._cache.items():
+            self._store[str(guest_id)] = guest
+        for guest_id, guest in list(self._live.items()):
+            if guest_id not in self._cache:
+                self._store[str(guest_id)] = guest
+        self._store.sync()
+    
+    def close(self):
+        """Write back cached guests and close the on-disk store"""
+        if self._store is not None:
+            self.flush()
+            self._store.close()
+            self._store = None
+    
+    def _cache_guest(self, guest_id, guest):
+        """Put a guest at the hot end of the cache, evicting the coldest if full"""
+        self._cache[guest_id] = guest
+        self._cache.move_to_end(guest_id)
+        self._live[guest_id] = guest
+        if self._store is not None:
+            guest.add_change_listener(self._on_guest_changed)
+        while self._capacity is not None and len(self._cache) > self._capacity:
+            evicted_id, evicted = self._cache.popitem(last=False)
+            self._store[str(evicted_id)] = evicted
+    
+    def _on_guest_changed(self, guest, field, old_value, new_value):
+        """Take an edited guest back into the cache, so the edit is written on eviction or flush"""
+        guest_id = guest.get_guest_id()
+        if guest_id not in self._cache:
+            self._cache_guest(guest_id, guest)
\ No newline at end of file
@@ -1,33 +1,86 @@
 from datetime import date, timedelta
 from typing import List, Dict
+from days import to_day
 from booking import Booking
 from payment import Payment, Invoice
-from service import Service, ServiceRequest
+from service import Service, ServiceRequest, PRIORITY_NORMAL
+from guest_index import GuestIndex
+from guest_store import GuestRepository, DEFAULT_CACHE_SIZE
+from loyalty import LoyaltyLedger
+from dispatch import ServiceDispatcher
+from stay_index import StayIndex
+from forecast import OccupancyForecaster
+from waitlist import Waitlist
+from snapshot import SnapshotStore
+from inventory import TypeInventory
+from room_assignment import RoomAssignmentOptimizer, OPTIMIZE_HORIZON_DAYS
+from night_audit import NightAuditor
+import events
 
 class Hotel:
     """Main class representing the hotel management system"""
     
-    def __init__(self, name):
+    def __init__(self, name, guest_store_path=None, guest_cache_size=DEFAULT_CACHE_SIZE,
+                 loyalty_ledger=None):
         """
         Initialize the Hotel object
         
         Args:
             name: Name of the hotel
+            guest_store_path: File for on-disk guest profiles; None keeps all guests in memory
+            guest_cache_size: Number of guest profiles kept in memory when stored on disk
+            loyalty_ledger: LoyaltyLedger shared with other hotels of a chain (defaults to a new one)
         """
         self._name = name
         self._rooms = []
-        self._guests = {}
+        self._rooms_by_number = {}
+        self._guests = GuestRepository(guest_store_path, guest_cache_size, self._attach_guest)
         self._staff = {}
         self._services = []
         self._room_types = []
         self._bookings = {}
         self._payments = {}
+        self._payments_by_booking = {}
         self._invoices = {}
+        self._guest_index = GuestIndex()
+        self._loyalty = loyalty_ledger or LoyaltyLedger()
+        self._dispatcher = ServiceDispatcher()
+        self._stay_index = StayIndex()
+        self._waitlist = Waitlist()
+        self._inventory = TypeInventory()
+        self._unassigned = {}
+        # IDs of bookings holding type inventory, so each hold is released once
+        self._inventory_holds = set()
+        self._last_audit_day = None
+        self._events = events.EventBus()
+        self._snapshots = SnapshotStore()
+        self._events.subscribe(self._update_snapshot_store)
+        
+        # Guests of a reopened store are indexed and get their points back
+        for guest in self._guests.iter_stored():
+            self._guest_index.add_guest(guest)
+            self._loyalty.open_account(guest.get_guest_id(), guest.get_loyalty_points())
     
     def get_name(self):
         """Get the hotel name"""
         return self._name
     
+    def get_rooms(self):
+        """Get the rooms of the hotel"""
+        return self._rooms.copy()
+    
+    def get_guest_ids(self):
+        """Get the IDs of all guests, including those stored on disk"""
+        return self._guests.keys()
+    
+    def get_staff(self):
+        """Get the staff members of the hotel"""
+        return list(self._staff.values())
+    
+    def get_services(self):
+        """Get the services offered by the hotel"""
+        return self._services.copy()
+    
     def add_room_type(self, room_type):
         """Add a room type to the hotel"""
         if room_type not in self._room_types:
@@ -37,11 +90,96 @@ class Hotel:
         """Add a room to the hotel"""
         if room not in self._rooms:
             self._rooms.append(room)
+            self._rooms_by_number[room.get_room_number()] = room
+            room.add_change_listener(self._on_room_changed)
+            self._inventory.add_room(room)
+            self._snapshots.record_room(room)
     
     def add_guest(self, guest):
-        """Add a guest to the hotel system"""
+        """
+        Add a guest to the hotel system
+        
+        Args:
+            guest: Guest to add
+            
+        Returns:
+            List[str]: IDs of existing guests registered with the same email,
+            so callers can review or merge likely duplicate profiles
+        """
+        duplicates = []
         if guest.get_guest_id() not in self._guests:
+            duplicates = self._guest_index.find_by_email(guest.get_email())
+            self._guest_index.add_guest(guest)
+            self._attach_guest(guest)
             self._guests[guest.get_guest_id()] = guest
+        return duplicates
+    
+    def _attach_guest(self, guest):
+        """Connect a new or reloaded guest to the index, loyalty ledger and bookings"""
+        self._guest_index.watch_guest(guest)
+        guest.set_loyalty_ledger(self._loyalty)
+        guest.relink_reservations(self._bookings)
+    
+    def close(self):
+        """Write cached guest profiles back to the on-disk store"""
+        self._guests.close()
+    
+    def find_guest_by_email(self, email):
+        """
+        Find a guest by email address
+        
+        Args:
+            email: Email address (case-insensitive)
+            
+        Returns:
+            Guest: The matching guest, or None
+        """
+        guest_ids = self._guest_index.find_by_email(email)
+        return self._guests.get(guest_ids[0]) if guest_ids else None
+    
+    def find_guests_by_contact(self, contact):
+        """
+        Find guests by phone number
+        
+        Args:
+            contact: Phone number, in any formatting
+            
+        Returns:
+            List[Guest]: Guests registered with this phone number
+        """
+        return [self._guests[g] for g in self._guest_index.find_by_contact(contact)]
+    
+    def find_guests_by_name(self, prefix, limit=20):
+        """
+        Find guests whose first, middle or last name starts with a prefix
+        
+        Args:
+            prefix: Name prefix for autocomplete (case-insensitive)
+            limit: Maximum number of guests to return
+            
+        Returns:
+            List[Guest]: Matching guests
+        """
+        return [self._guests[g] for g in self._guest_index.find_by_name_prefix(prefix, limit)]
+    
+    def find_duplicate_guests(self, name, contact, email):
+        """
+        Find existing guest profiles that look like the same person
+        
+        Args:
+            name: Full name
+            contact: Phone number
+            email: Email address
+            
+        Returns:
+            List[Guest]: Guests sharing the email, or sharing both phone and name
+        """
+        guest_ids = set(self._guest_index.find_by_email(email))
+        full_name = " ".join(name.lower().split())
+        for guest_id in self._guest_index.find_by_contact(contact):
+            if " ".join(self._guests[guest_id].get_name().lower().split()) == full_name:
+                guest_ids.add(guest_id)
+        return [self._guests[g] for g in sorted(guest_ids)]
     
     def add_staff(self, staff):
         """Add a staff member to the hotel"""
@@ -52,42 +190,238 @@ class Hotel:
         """Add a service to the hotel"""
         if service not in self._services:
             self._services.append(service)
+            service.add_change_listener(self._on_service_changed)
+    
+    def get_event_bus(self):
+        """Get the bus that publishes change events for this hotel"""
+        return self._events
+    
+    def subscribe(self, callback, event_types=None):
+        """
+        Subscribe to change events of this hotel
+        
+        Args:
+            callback: Callable taking a ChangeEvent
+            event_types: Event types to receive (defaults to all)
+        """
+        self._events.subscribe(callback, event_types)
+    
+    def snapshot(self):
+        """
+        Take a consistent, immutable point-in-time view for reports and exports
+        
+        Taking a snapshot copies nothing; later changes write new record
+        versions, so reading it never blocks or disturbs bookings.
+        
+        Returns:
+            HotelSnapshot: Bookings, payments and room calendars as of now
+        """
+        return self._snapshots.take_snapshot()
+    
+    def _update_snapshot_store(self, event):
+        """Record new versions of the bookings, payments and rooms an event changed"""
+        payload = event.get_payload()
+        event_type = event.get_event_type()
+        if event_type == events.ROOM_PRICE_CHANGED:
+            self._snapshots.record_room(self._rooms_by_number[payload["room_number"]])
+            return
+        if "booking_id" not in payload:
+            return
+        
+        # Everything the event touched is written as one version
+        booking = self._bookings[payload["booking_id"]]
+        rooms, payments = [], []
+        if (event_type in (events.BOOKING_CREATED, events.BOOKING_CANCELLED, events.BOOKING_ROOM_ASSIGNED)
+                and booking.get_room() is not None):
+            rooms.append(booking.get_room())
+        if payload.get("previous_room_number") is not None:
+            rooms.append(self._rooms_by_number[payload["previous_room_number"]])
+        payment_id = payload.get("payment_id") or payload.get("refunded_payment_id")
+        if payment_id:
+            payments.append(self._payments[payment_id])
+        self._snapshots.record(bookings=[booking], payments=payments, rooms=rooms)
+    
+    def _on_room_changed(self, room, field, old_value, new_value):
+        """Publish room changes that downstream consumers track"""
+        if field == "price":
+            self._events.publish(events.ROOM_PRICE_CHANGED, {
+                "room_number": room.get_room_number(),
+                "old_price_cents": old_value,
+                "price_cents": new_value,
+            })
+    
+    def _on_service_changed(self, service, field, old_value, new_value):
+        """Publish service changes that downstream consumers track"""
+        if field == "availability":
+            self._events.publish(events.SERVICE_AVAILABILITY_CHANGED, {
+                "service_id": service.get_service_id(),
+                "available": new_value,
+            })
     
     def find_available_rooms(self, check_in, check_out, room_type=None):
         """
         Find available rooms for given dates and optional room type
         """
+        first_day, last_day = to_day(check_in), to_day(check_out)
         available_rooms = []
         for room in self._rooms:
-            if room.check_availability(check_in, check_out):
-                if room_type is None or room.get_room_type().get_type_name().lower() == room_type.lower():
+            if room_type is None or room.get_room_type().get_type_name().lower() == room_type.lower():
+                if room.check_days(first_day, last_day):
                     available_rooms.append(room)
         return available_rooms
     
-    def make_booking(self, guest_id, room_number, check_in, check_out):
+    def make_booking(self, guest_id, room_number, check_in, check_out, booking_date=None):
         """
         Make a booking for a guest
+        
+        Args:
+            guest_id: Guest ID
+            room_number: Room number
+            check_in: Check-in date
+            check_out: Check-out date
+            booking_date: Date the booking was made (defaults to today)
+            
+        Returns:
+            Booking: The new booking
         """
         guest = self._guests.get(guest_id)
         if guest is None:
             raise ValueError("Guest not found")
         
-        room = next((r for r in self._rooms if r.get_room_number() == room_number), None)
+        room = self._rooms_by_number.get(room_number)
         if room is None:
             raise ValueError("Room not found")
         
-        if not room.check_availability(check_in, check_out):
+        first_day, last_day = to_day(check_in), to_day(check_out)
+        if not room.check_days(first_day, last_day):
             raise ValueError("Room not available for selected dates")
         
-        booking = Booking(guest, room, check_in, check_out)
-        self._bookings[booking.get_booking_id()] = booking
+        # Rooms of the type may already be promised to bookings awaiting assignment
+        type_name = room.get_room_type().get_type_name()
+        self._inventory.hold(type_name, first_day, last_day)
+        try:
+            booking = Booking(guest, room, check_in, check_out, booking_date,
+                              guest_lookup=self._guests.get)
+        except ValueError:
+            self._inventory.release(type_name, first_day, last_day)
+            raise
+        self._record_booking(booking, guest_id)
+        return booking
+    
+    def make_type_booking(self, guest_id, type_name, check_in, check_out, booking_date=None):
+        """
+        Book a room type for a guest, leaving the concrete room to assign_rooms
+        
+        The nightly rate is the lowest price among rooms of the type.
+        
+        Args:
+            guest_id: Guest ID
+            type_name: Room type name
+            check_in: Check-in date
+            check_out: Check-out date
+            booking_date: Date the booking was made (defaults to today)
+            
+        Returns:
+            Booking: The new booking, with no room yet
+        """
+        guest = self._guests.get(guest_id)
+        if guest is None:
+            raise ValueError("Guest not found")
         
-        # Add loyalty points (e.g., 10 points per night)
-        nights = (check_out - check_in).days
-        guest.add_loyalty_points(nights * 10)
+        rooms = [r for r in self._rooms
+                 if r.get_room_type().get_type_name().lower() == type_name.lower()]
+        if not rooms:
+            raise ValueError("Room type not found")
         
+        first_day, last_day = to_day(check_in), to_day(check_out)
+        self._inventory.hold(type_name, first_day, last_day)
+        try:
+            booking = Booking(guest, None, check_in, check_out, booking_date,
+                              rooms[0].get_room_type(), min(r.get_price_cents() for r in rooms),
+                              guest_lookup=self._guests.get)
+        except ValueError:
+            self._inventory.release(type_name, first_day, last_day)
+            raise
+        self._unassigned[booking.get_booking_id()] = booking
+        self._record_booking(booking, guest_id)
         return booking
     
+    def _record_booking(self, booking, guest_id):
+        """Register a new booking with the hotel's indexes and announce it"""
+        room = booking.get_room()
+        self._bookings[booking.get_booking_id()] = booking
+        self._inventory_holds.add(booking.get_booking_id())
+        self._stay_index.add_booking(booking)
+        self._events.publish(events.BOOKING_CREATED, {
+            "booking_id": booking.get_booking_id(),
+            "guest_id": guest_id,
+            "room_number": room.get_room_number() if room is not None else None,
+            "room_type": booking.get_room_type().get_type_name(),
+            "check_in": booking.get_check_in().isoformat(),
+            "check_out": booking.get_check_out().isoformat(),
+            "total_cost_cents": booking.get_total_cost_cents(),
+        })
+        # Loyalty points are earned once the stay is completed (see run_loyalty_accrual)
+    
+    def is_type_available(self, type_name, check_in, check_out):
+        """Check if any room of a type is unsold for every night of a stay"""
+        return self._inventory.is_available(type_name, to_day(check_in), to_day(check_out))
+    
+    def get_type_availability(self, check_in, check_out):
+        """
+        Get how many rooms of each type are unsold for every night of a stay
+        
+        Args:
+            check_in: Check-in date
+            check_out: Check-out date
+            
+        Returns:
+            Dict[str, int]: Room type name to number of rooms available
+        """
+        first_day, last_day = to_day(check_in), to_day(check_out)
+        return {room_type.get_type_name():
+                self._inventory.get_available_count(room_type.get_type_name(), first_day, last_day)
+                for room_type in self._room_types}
+    
+    def get_unassigned_bookings(self):
+        """Get the bookings that hold a room type but have no room yet"""
+        return list(self._unassigned.values())
+    
+    def assign_rooms(self, through=None):
+        """
+        Assign concrete rooms to type-level bookings, earliest arrival first
+        
+        Args:
+            through: Only assign bookings arriving on or before this date (None for all)
+            
+        Returns:
+            List[Booking]: Bookings that received a room; any that could not be
+            placed in a single room stay unassigned
+        """
+        last_arrival = to_day(through) if through is not None else None
+        pending = sorted((b for b in self._unassigned.values()
+                          if last_arrival is None or b.get_check_in_day() <= last_arrival),
+                         key=lambda b: (b.get_check_in_day(), -b.get_nights()))
+        rooms_by_type = {}
+        for room in self._rooms:
+            rooms_by_type.setdefault(room.get_room_type().get_type_name().lower(), []).append(room)
+        
+        assigned = []
+        for booking in pending:
+            first_day, last_day = booking.get_check_in_day(), booking.get_check_out_day()
+            candidates = rooms_by_type.get(booking.get_room_type().get_type_name().lower(), [])
+            room = next((r for r in candidates if r.check_days(first_day, last_day)), None)
+            if room is None:
+                continue
+            booking.assign_room(room)
+            del self._unassigned[booking.get_booking_id()]
+            self._events.publish(events.BOOKING_ROOM_ASSIGNED, {
+                "booking_id": booking.get_booking_id(),
+                "room_number": room.get_room_number(),
+            })
+            assigned.append(booking)
+        return assigned
+    
     def add_service_to_booking(self, booking_id, service_id):
         """
         Add a service to an existing booking
@@ -101,6 +435,12 @@ class Hotel:
             raise ValueError("Service not found")
         
         booking.add_service(service)
+        self._events.publish(events.BOOKING_SERVICE_ADDED, {
+            "booking_id": booking_id,
+            "service_id": service_id,
+            "price_cents": service.get_price_cents(),
+            "total_cost_cents": booking.get_total_cost_cents(),
+        })
     
     def process_payment(self, booking_id, amount, method):
         """
@@ -117,17 +457,60 @@ class Hotel:
         booking = self._bookings.get(booking_id)
         if booking is None:
             raise ValueError("Booking not found")
+        if booking.get_status() == "Cancelled":
+            raise ValueError("Cannot take payment for a cancelled booking")
         
         payment = Payment(booking, amount, method)
         payment.process_payment()
         self._payments[payment.get_payment_id()] = payment
+        self._payments_by_booking.setdefault(booking_id, []).append(payment)
         
         # Generate invoice
         invoice = Invoice(payment)
         self._invoices[invoice.get_invoice_id()] = invoice
+        self._events.publish(events.PAYMENT_PROCESSED, {
+            "payment_id": payment.get_payment_id(),
+            "booking_id": booking_id,
+            "invoice_id": invoice.get_invoice_id(),
+            "amount_cents": payment.get_amount_cents(),
+            "method": method,
+            "status": payment.get_status(),
+        })
         
         return payment
     
+    def optimize_room_assignments(self, today=None, horizon=OPTIMIZE_HORIZON_DAYS):
+        """
+        Move bookings that have not arrived yet between rooms of the same type
+        so that free nights form fewer, longer runs
+        
+        Args:
+            today: Date of the optimization (defaults to today)
+            horizon: Number of days ahead whose arrivals may be moved
+            
+        Returns:
+            dict: Room type name -> {"moved", "before", "after"}, with the
+            fragmentation before and after (see measure_fragmentation)
+        """
+        optimizer = RoomAssignmentOptimizer(horizon)
+        plans = optimizer.optimize(self._rooms, self._bookings.values(), today)
+        moves = [move for plan in plans.values() for move in plan["moves"]]
+        
+        # Free every moving stay first so bookings can swap rooms
+        previous_rooms = [booking.get_room() for booking, _ in moves]
+        for booking, _ in moves:
+            booking.unassign_room()
+        for (booking, room), previous_room in zip(moves, previous_rooms):
+            booking.assign_room(room)
+            self._events.publish(events.BOOKING_ROOM_ASSIGNED, {
+                "booking_id": booking.get_booking_id(),
+                "room_number": room.get_room_number(),
+                "previous_room_number": previous_room.get_room_number(),
+            })
+        
+        return {type_name: {"moved": len(plan["moves"]), "before": plan["before"], "after": plan["after"]}
+                for type_name, plan in plans.items()}
+    
     def cancel_booking(self, booking_id):
         """
         Cancel a booking
@@ -135,21 +518,154 @@ class Hotel:
         booking = self._bookings.get(booking_id)
         if booking is None:
             raise ValueError("Booking not found")
+        if booking.get_status() == "Cancelled":
+            raise ValueError("Booking already cancelled")
         
         booking.cancel_booking()
+        if booking_id in self._inventory_holds:
+            self._inventory_holds.discard(booking_id)
+            self._inventory.release(booking.get_room_type().get_type_name(),
+                                    booking.get_check_in_day(), booking.get_check_out_day())
+        self._unassigned.pop(booking_id, None)
+        self._stay_index.remove_booking(booking)
+        self._loyalty_ledger_for(booking.get_guest_id()).reverse_booking(booking_id)
         
         # Process refund if payment was made
-        payment = next((p for p in self._payments.values() if p.get_booking().get_booking_id() == booking_id), None)
-        if payment and payment.get_status() == "Completed":
+        payment = next(iter(self._payments_by_booking.get(booking_id, ())), None)
+        refunded = payment is not None and payment.get_status() == "Completed"
+        if refunded:
             payment.refund_payment()
+        self._events.publish(events.BOOKING_CANCELLED, {
+            "booking_id": booking_id,
+            "room_number": booking.get_room().get_room_number() if booking.get_room() is not None else None,
+            "check_in": booking.get_check_in().isoformat(),
+            "check_out": booking.get_check_out().isoformat(),
+            "refunded_payment_id": payment.get_payment_id() if refunded else None,
+        })
+        
+        # Offer the freed dates to the waitlist
+        if booking.get_room() is not None:
+            self._fill_from_waitlist(booking.get_room(), booking.get_check_in(), booking.get_check_out())
+    
+    def add_to_waitlist(self, guest_id, check_in, check_out, room_type=None, priority=0):
+        """
+        Put a guest on the waitlist for dates that are currently sold out
+        
+        Args:
+            guest_id: Guest ID
+            check_in: Requested check-in date
+            check_out: Requested check-out date
+            room_type: Requested room type name, or None for any type
+            priority: Lower numbers are served first
+            
+        Returns:
+            WaitlistEntry: The waitlist entry
+        """
+        if guest_id not in self._guests:
+            raise ValueError("Guest not found")
+        
+        return self._waitlist.add(guest_id, check_in, check_out, room_type, priority)
     
-    def create_service_request(self, guest_id, service_id):
+    def cancel_waitlist_entry(self, entry_id):
         """
-        Create a service request for a guest
+        Withdraw a waitlist entry
+        
+        Args:
+            entry_id: Waitlist entry ID
+        """
+        entry = self._waitlist.get_entry(entry_id)
+        if entry is None:
+            raise ValueError("Waitlist entry not found")
+        
+        entry.cancel()
+        self._waitlist.remove(entry_id)
+    
+    def _fill_from_waitlist(self, room, check_in, check_out):
+        """
+        Auto-book waitlisted guests into dates freed on a room, in priority order
+        
+        Args:
+            room: Room with newly freed dates
+            check_in: Start of the freed dates
+            check_out: End of the freed dates
+            
+        Returns:
+            List[Booking]: Bookings made from the waitlist
+        """
+        window_start, window_end = room.get_free_window(check_in, check_out)
+        candidates = self._waitlist.find_candidates(room.get_room_type().get_type_name(),
+                                                    check_in, check_out, window_start, window_end)
+        type_name = room.get_room_type().get_type_name()
+        bookings = []
+        for entry in candidates:
+            if not room.check_availability(entry.get_check_in(), entry.get_check_out()):
+                continue
+            # The room may be free while its type is already promised to
+            # bookings awaiting assignment
+            if not self._inventory.is_available(type_name, to_day(entry.get_check_in()),
+                                                to_day(entry.get_check_out())):
+                continue
+            booking = self.make_booking(entry.get_guest_id(), room.get_room_number(),
+                                        entry.get_check_in(), entry.get_check_out())
+            entry.mark_booked(booking)
+            self._waitlist.remove(entry.get_entry_id())
+            bookings.append(booking)
+        return bookings
+    
+    def run_loyalty_accrual(self, as_of=None):
+        """
+        Accrue loyalty points for all stays completed by a date
+        
+        Args:
+            as_of: Date of the run (defaults to today)
+            
+        Returns:
+            int: Number of bookings that earned points
+        """
+        return self._loyalty.accrue_completed_stays(self._bookings.values(), as_of,
+                                                    self._loyalty_ledger_for)
+    
+    def run_loyalty_expiry(self, as_of=None):
+        """
+        Expire loyalty points that are past the expiry window
+        
+        Args:
+            as_of: Date of the run (defaults to today)
+            
+        Returns:
+            int: Total points expired
+        """
+        return self._loyalty.expire_points(as_of)
+    
+    def get_loyalty_history(self, guest_id):
+        """
+        Get the loyalty point transactions of a guest
+        
+        Args:
+            guest_id: Guest ID
+            
+        Returns:
+            List[dict]: Transactions in posting order
+        """
+        if guest_id not in self._guests:
+            raise ValueError("Guest not found")
+        return self._loyalty_ledger_for(guest_id).get_transactions(guest_id)
+    
+    def _loyalty_ledger_for(self, guest_id):
+        """Get the ledger keeping a guest's points, which is another hotel's for
+        guests that were registered there first"""
+        guest = self._guests.get(guest_id)
+        ledger = guest.get_loyalty_ledger() if guest is not None else None
+        return ledger or self._loyalty
+    
+    def create_service_request(self, guest_id, service_id, priority=PRIORITY_NORMAL):
+        """
+        Create a service request for a guest and queue it for dispatch
         
         Args:
             guest_id: Guest ID
             service_id: Service ID
+            priority: Request priority (PRIORITY_URGENT to PRIORITY_LOW)
             
         Returns:
             ServiceRequest: The created service request
@@ -165,9 +681,55 @@ class Hotel:
         if not service.is_available():
             raise ValueError("Service is not currently available")
         
-        request = ServiceRequest(guest, service)
+        request = ServiceRequest(guest, service, priority, guest_lookup=self._guests.get)
+        self._dispatcher.submit(request)
         return request
     
+    def claim_service_request(self, staff_id):
+        """
+        Assign the most urgent pending request of a staff member's department
+        
+        Args:
+            staff_id: Staff ID
+            
+        Returns:
+            ServiceRequest: The claimed request, or None if there is no pending work
+        """
+        staff = self._staff.get(staff_id)
+        if staff is None:
+            raise ValueError("Staff not found")
+        
+        return self._dispatcher.claim(staff)
+    
+    def fulfill_service_request(self, request_id):
+        """
+        Mark a service request as fulfilled
+        
+        Args:
+            request_id: Service request ID
+        """
+        request = self._dispatcher.get_request(request_id)
+        if request is None:
+            raise ValueError("Service request not found")
+        
+        request.fulfill_request()
+    
+    def get_pending_service_requests(self, department):
+        """
+        Get the pending service requests of a department, most urgent first
+        
+        Args:
+            department: Department name
+            
+        Returns:
+            List[ServiceRequest]: Pending requests
+        """
+        return self._dispatcher.get_pending(department)
+    
+    def get_service_metrics(self):
+        """Get service queue-depth and time-to-fulfill metrics"""
+        return self._dispatcher.get_metrics()
+    
     def get_guest_bookings(self, guest_id):
         """
         Get all bookings for a guest
@@ -182,7 +744,155 @@ class Hotel:
         if guest is None:
             raise ValueError("Guest not found")
         
-        return [b for b in self._bookings.values() if b.get_guest().get_guest_id() == guest_id]
+        return [b for b in self._bookings.values() if b.get_guest_id() == guest_id]
+    
+    def get_arrivals(self, day=None):
+        """
+        Get the bookings checking in on a date
+        
+        Args:
+            day: Date (defaults to today)
+            
+        Returns:
+            List[Booking]: Arriving bookings
+        """
+        return self._stay_index.get_arrivals(day or date.today())
+    
+    def get_departures(self, day=None):
+        """
+        Get the bookings checking out on a date
+        
+        Args:
+            day: Date (defaults to today)
+            
+        Returns:
+            List[Booking]: Departing bookings
+        """
+        return self._stay_index.get_departures(day or date.today())
+    
+    def get_in_house(self, day=None):
+        """
+        Get the bookings staying the night of a date
+        
+        Args:
+            day: Date (defaults to today)
+            
+        Returns:
+            List[Booking]: In-house bookings
+        """
+        return self._stay_index.get_in_house(day or date.today())
+    
+    def iter_turnovers(self, start=None, days=7):
+        """
+        Stream upcoming room turnovers for the housekeeping schedule
+        
+        Args:
+            start: First date (defaults to today)
+            days: Number of days to cover
+            
+        Yields:
+            tuple: (date, room, departing booking, arriving booking or None)
+        """
+        return self._stay_index.iter_turnovers(start or date.today(), days)
+    
+    def forecast_occupancy(self, horizon=365, today=None):
+        """
+        Forecast rooms sold, occupancy and revenue by room type
+        
+        Args:
+            horizon: Number of days to forecast
+            today: Date the forecast is made (defaults to today)
+            
+        Returns:
+            dict: Room type name -> daily series (see OccupancyForecaster.forecast)
+        """
+        forecaster = OccupancyForecaster(horizon)
+        return forecaster.forecast(self._rooms, self._bookings.values(), today)
+    
+    def run_night_audit(self, day=None):
+        """
+        Close a business day: post the night's charges for every stay in house,
+        complete stays that checked out and flag payment mismatches
+        
+        Departures on days skipped since the previous audit are picked up too;
+        the first audit picks up every stay that checked out before it.
+        
+        Args:
+            day: Date of the night being audited (defaults to today)
+            
+        Returns:
+            dict: "day" plus the audit result (see NightAuditor.audit)
+        """
+        day = day or date.today()
+        audit_day = to_day(day)
+        if self._last_audit_day is not None and audit_day <= self._last_audit_day:
+            raise ValueError("Night audit already run for this date")
+        
+        first_day = None if self._last_audit_day is None else self._last_audit_day + 1
+        departures = self._stay_index.get_departures_between(first_day, audit_day)
+        result = NightAuditor().audit(self._stay_index.get_in_house(audit_day), departures,
+                                      self._payments_by_booking, audit_day)
+        self._last_audit_day = audit_day
+        
+        for booking, room_cents, service_cents in result["posted"]:
+            self._events.publish(events.BOOKING_CHARGES_POSTED, {
+                "booking_id": booking.get_booking_id(),
+                "day": day.isoformat(),
+                "room_charges_cents": room_cents,
+                "service_charges_cents": service_cents,
+                "posted_cents": booking.get_posted_charges_cents(),
+            })
+        for booking in result["completed"]:
+            self._events.publish(events.BOOKING_COMPLETED, {
+                "booking_id": booking.get_booking_id(),
+                "check_out": booking.get_check_out().isoformat(),
+                "total_cost_cents": booking.get_total_cost_cents(),
+            })
+        self._events.publish(events.NIGHT_AUDIT_COMPLETED, {
+            "day": day.isoformat(),
+            "room_charges_cents": result["room_charges_cents"],
+            "service_charges_cents": result["service_charges_cents"],
+            "completed": len(result["completed"]),
+            "mismatched_booking_ids": [booking.get_booking_id() for booking, _, _ in result["mismatches"]],
+        })
+        
+        result["day"] = day
+        return result
+    
+    def get_revenue_summary(self):
+        """
+        Get exact revenue and tax totals over all invoices and payments
+        
+        Returns:
+            dict: Totals in integer cents: room_charges, service_charges and
+            tax of every invoiced booking that was not cancelled, invoiced,
+            cancelled (invoiced totals of cancelled bookings), collected and
+            refunded
+        """
+        # Every payment issues an invoice for the whole booking, so charges are
+        # counted once per booking, from its latest invoice
+        latest_invoices = {}
+        for invoice in self._invoices.values():
+            latest_invoices[invoice.get_payment().get_booking().get_booking_id()] = invoice
+        invoices, cancelled = [], 0
+        for invoice in latest_invoices.values():
+            if invoice.get_payment().get_booking().get_status() == "Cancelled":
+                cancelled += invoice.get_total_cents()
+            else:
+                invoices.append(invoice)
+        payments = self._payments.values()
+        room = sum(i.get_room_charges_cents() for i in invoices)
+        services = sum(i.get_service_charges_cents() for i in invoices)
+        tax = sum(i.get_tax_cents() for i in invoices)
+        return {
+            "room_charges": room,
+            "service_charges": services,
+            "tax": tax,
+            "invoiced": room + services + tax,
+            "cancelled": cancelled,
+            "collected": sum(p.get_amount_cents() for p in payments if p.get_status() == "Completed"),
+            "refunded": sum(p.get_amount_cents() for p in payments if p.get_status() == "Refunded"),
+        }
     
     def get_invoice(self, booking_id):
         """
@@ -194,7 +904,7 @@ class Hotel:
         Returns:
             Invoice: The invoice for the booking
         """
-        payment = next((p for p in self._payments.values() if p.get_booking().get_booking_id() == booking_id), None)
+        payment = next(iter(self._payments_by_booking.get(booking_id, ())), None)
         if payment is None:
             raise ValueError("No payment found for this booking")
         
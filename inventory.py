@@ -0,0 +1,86 @@
+from array import array
+
+
+class TypeInventory:
+    """Rooms sold per room type and night, for availability checks without room lookups"""
+    
+    def __init__(self):
+        """Initialize an empty TypeInventory"""
+        self._capacity = {}
+        self._sold = {}
+        self._calendar_start = {}
+    
+    def add_room(self, room):
+        """Count a room in the capacity of its type"""
+        key = self._key(room.get_room_type().get_type_name())
+        self._capacity[key] = self._capacity.get(key, 0) + 1
+        self._sold.setdefault(key, array("l"))
+    
+    def get_capacity(self, type_name):
+        """Get the number of rooms of a type"""
+        return self._capacity.get(self._key(type_name), 0)
+    
+    def get_available_count(self, type_name, first_day, last_day):
+        """
+        Get how many rooms of a type are free on every night of a stay
+        
+        Args:
+            type_name: Room type name
+            first_day: Check-in day ordinal
+            last_day: Check-out day ordinal
+        
+        Returns:
+            int: Rooms of the type still unsold for the whole stay
+        """
+        if first_day >= last_day:
+            raise ValueError("Check-in date must be before check-out date")
+        key = self._key(type_name)
+        capacity = self._capacity.get(key, 0)
+        sold = self._sold.get(key)
+        if not sold:
+            return capacity
+        start = max(first_day - self._calendar_start[key], 0)
+        end = min(last_day - self._calendar_start[key], len(sold))
+        if start >= end:
+            return capacity
+        return capacity - max(sold[start:end])
+    
+    def is_available(self, type_name, first_day, last_day):
+        """Check if at least one room of a type is unsold for every night of a stay"""
+        return self.get_available_count(type_name, first_day, last_day) > 0
+    
+    def hold(self, type_name, first_day, last_day):
+        """
+        Count one more room of a type as sold for each night of a stay
+        
+        Args:
+            type_name: Room type name
+            first_day: Check-in day ordinal
+            last_day: Check-out day ordinal
+        """
+        if not self.is_available(type_name, first_day, last_day):
+            raise ValueError("No rooms of this type available for the selected dates")
+        key = self._key(type_name)
+        sold = self._sold[key]
+        if not sold:
+            self._calendar_start[key] = first_day
+        elif first_day < self._calendar_start[key]:
+            sold[0:0] = array("l", [0]) * (self._calendar_start[key] - first_day)
+            self._calendar_start[key] = first_day
+        end = last_day - self._calendar_start[key]
+        if end > len(sold):
+            sold.extend(array("l", [0]) * (end - len(sold)))
+        for night in range(first_day - self._calendar_start[key], end):
+            sold[night] += 1
+    
+    def release(self, type_name, first_day, last_day):
+        """Return a held room of a type to inventory for each night of a stay"""
+        key = self._key(type_name)
+        sold = self._sold[key]
+        offset = self._calendar_start.get(key, 0)
+        for night in range(first_day - offset, last_day - offset):
+            sold[night] -= 1
+    
+    def _key(self, type_name):
+        """Room type names are matched case-insensitively"""
+        return type_name.lower()
\ No newline at end of file
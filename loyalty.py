@@ -0,0 +1,235 @@
+from array import array
+from datetime import date
+from days import to_day, to_date
+
+LOYALTY_POINTS_PER_NIGHT = 10
+LOYALTY_EXPIRY_DAYS = 730
+
+
+class LoyaltyLedger:
+    """Append-only ledger of loyalty point transactions with cached balances"""
+    
+    KINDS = ("Opening", "Accrual", "Redemption", "Reversal", "Expiry")
+    
+    def __init__(self, points_per_night=LOYALTY_POINTS_PER_NIGHT, expiry_days=LOYALTY_EXPIRY_DAYS):
+        """
+        Initialize an empty LoyaltyLedger
+        
+        Args:
+            points_per_night: Points earned per night of a completed stay
+            expiry_days: Days after which earned points expire
+        """
+        self._points_per_night = points_per_night
+        self._expiry_days = expiry_days
+        self._accounts = {}
+        self._account_ids = []
+        self._balances = array("q")
+        # Transactions are stored column-wise so batch passes scan flat arrays
+        self._tx_account = array("l")
+        self._tx_points = array("q")
+        self._tx_kind = array("b")
+        self._tx_day = array("l")
+        self._tx_earned_day = array("l")
+        self._tx_booking = []
+        # Positions of each account's transactions, for history lookups
+        self._account_tx = []
+        self._accrued_bookings = {}
+    
+    def open_account(self, guest_id, opening_balance=0, day=None):
+        """
+        Open a loyalty account for a guest
+        
+        Args:
+            guest_id: Guest ID
+            opening_balance: Points carried over from before the ledger existed
+            day: Date of the opening transaction (defaults to today)
+        """
+        if guest_id in self._accounts:
+            return
+        self._accounts[guest_id] = len(self._account_ids)
+        self._account_ids.append(guest_id)
+        self._balances.append(0)
+        self._account_tx.append(array("l"))
+        if opening_balance > 0:
+            self._post(guest_id, opening_balance, "Opening", day)
+    
+    def has_account(self, guest_id):
+        """Check if a guest has a loyalty account"""
+        return guest_id in self._accounts
+    
+    def get_balance(self, guest_id):
+        """Get the cached point balance of a guest"""
+        account = self._accounts.get(guest_id)
+        if account is None:
+            raise ValueError("Loyalty account not found")
+        return self._balances[account]
+    
+    def add_points(self, guest_id, points, day=None):
+        """Credit points to a guest's account"""
+        if not isinstance(points, int) or points <= 0:
+            raise ValueError("Points must be a positive integer")
+        self._post(guest_id, points, "Accrual", day)
+    
+    def redeem_points(self, guest_id, points, day=None):
+        """Debit redeemed points from a guest's account"""
+        if not isinstance(points, int) or points <= 0:
+            raise ValueError("Points must be a positive integer")
+        if points > self.get_balance(guest_id):
+            raise ValueError("Not enough loyalty points")
+        self._post(guest_id, -points, "Redemption", day)
+    
+    def get_transactions(self, guest_id):
+        """
+        Get the transaction history of a guest
+        
+        Args:
+            guest_id: Guest ID
+        
+        Returns:
+            List[dict]: Transactions in posting order
+        """
+        account = self._accounts.get(guest_id)
+        if account is None:
+            raise ValueError("Loyalty account not found")
+        return [
+            {
+                "day": to_date(self._tx_day[i]),
+                "kind": self.KINDS[self._tx_kind[i]],
+                "points": self._tx_points[i],
+                "booking_id": self._tx_booking[i],
+            }
+            for i in self._account_tx[account]
+        ]
+    
+    def accrue_completed_stays(self, bookings, as_of=None, ledger_for=None):
+        """
+        Accrue points for every stay that has checked out and not yet earned points
+        
+        Args:
+            bookings: Iterable of bookings to consider
+            as_of: Date of the accrual run (defaults to today)
+            ledger_for: Callable returning the ledger that keeps a guest's points,
+                for guests without an account on this ledger (None skips them)
+        
+        Returns:
+            int: Number of bookings that earned points
+        """
+        as_of_day = to_day(as_of or date.today())
+        count = 0
+        for booking in bookings:
+            if booking.get_status() == "Cancelled" or booking.get_check_out_day() > as_of_day:
+                continue
+            ledger = self
+            guest_id = booking.get_guest_id()
+            if guest_id not in self._accounts:
+                ledger = ledger_for(guest_id) if ledger_for is not None else None
+                if ledger is None or not ledger.has_account(guest_id):
+                    continue
+            if ledger._accrue(booking, as_of_day):
+                count += 1
+        return count
+    
+    def _accrue(self, booking, as_of_day):
+        """Post the points of one completed stay, unless it already earned them"""
+        booking_id = booking.get_booking_id()
+        if booking_id in self._accrued_bookings:
+            return False
+        points = booking.get_nights() * self._points_per_night
+        if points <= 0:
+            return False
+        self._accrued_bookings[booking_id] = len(self._tx_points)
+        self._post(booking.get_guest_id(), points, "Accrual", as_of_day, booking_id,
+                   earned_day=booking.get_check_out_day())
+        return True
+    
+    def reverse_booking(self, booking_id, day=None):
+        """
+        Reverse the points a booking earned, e.g. after a cancellation
+        
+        Only the part of the accrual the guest still holds is reversed: points
+        already consumed by redemptions or expiry (oldest first) are not
+        taken back again.
+        
+        Args:
+            booking_id: Booking ID
+            day: Date of the reversal (defaults to today)
+        
+        Returns:
+            int: Points reversed (0 if the booking never earned points)
+        """
+        tx = self._accrued_bookings.pop(booking_id, None)
+        if tx is None:
+            return 0
+        points = self._remaining_credit(tx)
+        if points <= 0:
+            return 0
+        guest_id = self._account_ids[self._tx_account[tx]]
+        self._post(guest_id, -points, "Reversal", day, booking_id,
+                   earned_day=self._tx_earned_day[tx])
+        return points
+    
+    def _remaining_credit(self, tx):
+        """Get how much of a credit is left after debits consume credits oldest first"""
+        redemption, expiry = self.KINDS.index("Redemption"), self.KINDS.index("Expiry")
+        earned_day = self._tx_earned_day[tx]
+        credited = debited = 0
+        for i in self._account_tx[self._tx_account[tx]]:
+            if self._tx_kind[i] == redemption or self._tx_kind[i] == expiry:
+                debited -= self._tx_points[i]
+            elif self._tx_earned_day[i] < earned_day or i == tx:
+                credited += self._tx_points[i]
+        return max(0, min(self._tx_points[tx], credited - debited))
+    
+    def expire_points(self, as_of=None):
+        """
+        Expire points earned before the expiry window in one pass over the ledger
+        
+        Points are consumed oldest first, so a guest loses whatever they earned
+        before the cutoff that has not already been redeemed or expired.
+        
+        Args:
+            as_of: Date of the expiry run (defaults to today)
+        
+        Returns:
+            int: Total points expired across all guests
+        """
+        as_of_day = to_day(as_of or date.today())
+        cutoff = as_of_day - self._expiry_days
+        old_credits = array("q", [0]) * len(self._account_ids)
+        debits = array("q", [0]) * len(self._account_ids)
+        redemption, expiry = self.KINDS.index("Redemption"), self.KINDS.index("Expiry")
+        
+        for account, points, kind, earned_day in zip(self._tx_account, self._tx_points,
+                                                     self._tx_kind, self._tx_earned_day):
+            if kind == redemption or kind == expiry:
+                debits[account] -= points
+            elif earned_day < cutoff:
+                old_credits[account] += points
+        
+        total = 0
+        for account, (credit, debit) in enumerate(zip(old_credits, debits)):
+            expired = min(credit - debit, self._balances[account])
+            if expired > 0:
+                self._post(self._account_ids[account], -expired, "Expiry", as_of_day)
+                total += expired
+        return total
+    
+    def _post(self, guest_id, points, kind, day=None, booking_id=None, earned_day=None):
+        """Append a transaction and update the cached balance"""
+        account = self._accounts.get(guest_id)
+        if account is None:
+            raise ValueError("Loyalty account not found")
+        day = to_day(day or date.today())
+        self._tx_account.append(account)
+        self._tx_points.append(points)
+        self._tx_kind.append(self.KINDS.index(kind))
+        self._tx_day.append(day)
+        self._tx_earned_day.append(earned_day if earned_day is not None else day)
+        self._tx_booking.append(booking_id)
+        self._account_tx[account].append(len(self._tx_points) - 1)
+        self._balances[account] += points
+    
+    def __str__(self):
+        """String representation of the LoyaltyLedger"""
+        return (f"Loyalty Ledger: {len(self._account_ids)} accounts, "
+                f"{len(self._tx_points)} transactions")
\ No newline at end of file
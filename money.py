@@ -0,0 +1,48 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+CENTS_PER_UNIT = 100
+BASIS_POINTS = 10000
+
+
+def to_cents(amount):
+    """
+    Convert an amount of money to integer cents, rounding half up
+    
+    Args:
+        amount: Amount as an int, float, Decimal or numeric string
+    
+    Returns:
+        int: The amount in cents
+    """
+    if isinstance(amount, bool) or not isinstance(amount, (int, float, Decimal, str)):
+        raise ValueError("Amount must be a number")
+    cents = (Decimal(str(amount)) * CENTS_PER_UNIT).quantize(Decimal(1), rounding=ROUND_HALF_UP)
+    return int(cents)
+
+
+def from_cents(cents):
+    """Convert integer cents to a float amount, for display and the public getters"""
+    return cents / CENTS_PER_UNIT
+
+
+def format_cents(cents):
+    """Format integer cents as a dollar amount with two decimals"""
+    sign = "-" if cents < 0 else ""
+    units, remainder = divmod(abs(cents), CENTS_PER_UNIT)
+    return f"{sign}{units}.{remainder:02d}"
+
+
+def apply_rate(cents, basis_points):
+    """
+    Apply a rate given in basis points to an amount in cents, rounding half up
+    
+    Args:
+        cents: Amount in cents
+        basis_points: Rate in hundredths of a percent (1000 = 10%)
+    
+    Returns:
+        int: The resulting amount in cents
+    """
+    numerator = abs(cents) * basis_points
+    result = (numerator + BASIS_POINTS // 2) // BASIS_POINTS
+    return -result if cents < 0 else result
\ No newline at end of file
@@ -0,0 +1,91 @@
+from datetime import date
+
+
+class NightAuditor:
+    """Nightly close of business: posts charges, checks out stays and reconciles payments"""
+    
+    def audit(self, in_house, departures, payments_by_booking, day):
+        """
+        Audit one hotel's night in a single pass over the stays it touches
+        
+        Every stay in house that night gets its room night and any new
+        services posted to its folio. Stays that checked out since the last
+        audit get their remaining charges posted and are marked Completed.
+        Any audited stay whose completed payments differ from its total is
+        flagged; stays still in house are only flagged once they have paid
+        something.
+        
+        Args:
+            in_house: Bookings staying the night of the audit day
+            departures: Bookings that checked out since the last audit
+            payments_by_booking: Dict of booking ID -> payments for that booking
+            day: Day ordinal of the night being audited
+        
+        Returns:
+            dict: "room_charges_cents", "service_charges_cents", "posted"
+            (list of (booking, room cents, service cents)), "completed"
+            (list of bookings) and "mismatches" (list of (booking, total
+            cents, paid cents))
+        """
+        room_total = service_total = 0
+        posted, completed, mismatches = [], [], []
+        audited = [(booking, False) for booking in in_house] + [(booking, True) for booking in departures]
+        for booking, is_departure in audited:
+            if booking.get_status() == "Cancelled":
+                continue
+            room_cents, service_cents = booking.post_charges(day)
+            if room_cents or service_cents:
+                room_total += room_cents
+                service_total += service_cents
+                posted.append((booking, room_cents, service_cents))
+            if is_departure and booking.get_status() == "Confirmed":
+                booking.set_status("Completed")
+                completed.append(booking)
+            
+            paid = sum(p.get_amount_cents() for p in payments_by_booking.get(booking.get_booking_id(), ())
+                       if p.get_status() == "Completed")
+            total = booking.get_total_cost_cents()
+            if paid != total and (paid or is_departure):
+                mismatches.append((booking, total, paid))
+        
+        return {
+            "room_charges_cents": room_total,
+            "service_charges_cents": service_total,
+            "posted": posted,
+            "completed": completed,
+            "mismatches": mismatches,
+        }
+
+
+def audit_chain(hotels, day=None):
+    """
+    Run the night audit for every hotel of a chain
+    
+    Args:
+        hotels: Hotels to audit
+        day: Date of the night being audited (defaults to today)
+    
+    A hotel that cannot be audited (e.g. it was already audited for the
+    night) is reported under "errors" and does not stop the other hotels.
+    
+    Returns:
+        dict: "hotels" (hotel name -> that hotel's audit result, see
+        Hotel.run_night_audit), "errors" (hotel name -> error message) and
+        chain-wide "room_charges_cents", "service_charges_cents",
+        "completed" and "mismatches" counts
+    """
+    day = day or date.today()
+    results, errors = {}, {}
+    for hotel in hotels:
+        try:
+            results[hotel.get_name()] = hotel.run_night_audit(day)
+        except ValueError as e:
+            errors[hotel.get_name()] = str(e)
+    return {
+        "hotels": results,
+        "errors": errors,
+        "room_charges_cents": sum(r["room_charges_cents"] for r in results.values()),
+        "service_charges_cents": sum(r["service_charges_cents"] for r in results.values()),
+        "completed": sum(len(r["completed"]) for r in results.values()),
+        "mismatches": sum(len(r["mismatches"]) for r in results.values()),
+    }
\ No newline at end of file
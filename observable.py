@@ -0,0 +1,32 @@
+class Observable:
+    """Base class for objects that notify listeners when their fields change"""
+    
+    def __init__(self):
+        """Initialize an Observable object with no listeners"""
+        self._change_listeners = []
+    
+    def add_change_listener(self, listener):
+        """
+        Register a listener to be called on every change
+        
+        Args:
+            listener: Callable taking (obj, field, old_value, new_value)
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener):
+        """Unregister a previously added listener"""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    def _notify_change(self, field, old_value, new_value):
+        """Call every registered listener with the change details"""
+        for listener in list(self._change_listeners):
+            listener(self, field, old_value, new_value)
+    
+    def __getstate__(self):
+        """Pickle without listeners, which belong to the running process"""
+        state = self.__dict__.copy()
+        state["_change_listeners"] = []
+        return state
\ No newline at end of file
@@ -1,3 +1,8 @@
+from money import to_cents, from_cents, format_cents, apply_rate
+
+TAX_RATE_BASIS_POINTS = 1000  # 10% tax for example
+
+
 class Payment:
     """Class representing a payment for a booking"""
     
@@ -12,7 +17,7 @@ class Payment:
         """
         self._payment_id = self._generate_payment_id()
         self._booking = booking
-        self._amount = amount
+        self._amount_cents = to_cents(amount)
         self._method = method
         self._status = "Pending"
     
@@ -33,7 +38,11 @@ class Payment:
     
     def get_amount(self):
         """Get the payment amount"""
-        return self._amount
+        return from_cents(self._amount_cents)
+    
+    def get_amount_cents(self):
+        """Get the payment amount in cents"""
+        return self._amount_cents
     
     def get_method(self):
         """Get the payment method"""
@@ -50,26 +59,26 @@ class Payment:
         
         # In a real system, this would integrate with a payment gateway
         self._status = "Completed"
-        self._booking.set_status("Confirmed")
+        if self._booking.get_status() != "Completed":
+            self._booking.set_status("Confirmed")
     
     def refund_payment(self, amount=None):
         """Process a refund"""
-        if amount is None:
-            amount = self._amount
+        amount_cents = self._amount_cents if amount is None else to_cents(amount)
         
-        if amount > self._amount:
+        if amount_cents > self._amount_cents:
             raise ValueError("Refund amount cannot exceed original payment")
         
         # In a real system, this would process the refund
         self._status = "Refunded"
-        if amount == self._amount:
+        if amount_cents == self._amount_cents:
             self._booking.set_status("Cancelled")
     
     def __str__(self):
         """String representation of the Payment"""
         return (f"Payment ID: {self._payment_id}\n"
                 f"Booking ID: {self._booking.get_booking_id()}\n"
-                f"Amount: ${self._amount:.2f}\n"
+                f"Amount: ${format_cents(self._amount_cents)}\n"
                 f"Method: {self._method}\n"
                 f"Status: {self._status}")
 
@@ -86,7 +95,7 @@ class Invoice:
         """
         self._invoice_id = self._generate_invoice_id()
         self._payment = payment
-        self._tax_rate = 0.10  # 10% tax for example
+        self._tax_rate_basis_points = TAX_RATE_BASIS_POINTS
         self._calculate_totals()
     
     def _generate_invoice_id(self):
@@ -99,11 +108,11 @@ class Invoice:
     def _calculate_totals(self):
         """Calculate invoice totals"""
         booking = self._payment.get_booking()
-        self._room_charges = booking.get_total_cost() - sum(
-            s.get_price() for s in booking.get_additional_services())
-        self._service_charges = sum(s.get_price() for s in booking.get_additional_services())
-        self._tax = (self._room_charges + self._service_charges) * self._tax_rate
-        self._total = self._room_charges + self._service_charges + self._tax
+        self._room_charges_cents = booking.get_room_charges_cents()
+        self._service_charges_cents = booking.get_service_charges_cents()
+        self._tax_cents = apply_rate(self._room_charges_cents + self._service_charges_cents,
+                                     self._tax_rate_basis_points)
+        self._total_cents = self._room_charges_cents + self._service_charges_cents + self._tax_cents
     
     def get_invoice_id(self):
         """Get the invoice ID"""
@@ -115,19 +124,35 @@ class Invoice:
     
     def get_room_charges(self):
         """Get the room charges"""
-        return self._room_charges
+        return from_cents(self._room_charges_cents)
+    
+    def get_room_charges_cents(self):
+        """Get the room charges in cents"""
+        return self._room_charges_cents
     
     def get_service_charges(self):
         """Get the service charges"""
-        return self._service_charges
+        return from_cents(self._service_charges_cents)
+    
+    def get_service_charges_cents(self):
+        """Get the service charges in cents"""
+        return self._service_charges_cents
     
     def get_tax(self):
         """Get the tax amount"""
-        return self._tax
+        return from_cents(self._tax_cents)
+    
+    def get_tax_cents(self):
+        """Get the tax amount in cents"""
+        return self._tax_cents
     
     def get_total(self):
         """Get the total amount"""
-        return self._total
+        return from_cents(self._total_cents)
+    
+    def get_total_cents(self):
+        """Get the total amount in cents"""
+        return self._total_cents
     
     def generate_invoice(self):
         """Generate a formatted invoice string"""
@@ -135,25 +160,25 @@ class Invoice:
         invoice_lines = [
             f"Invoice ID: {self._invoice_id}",
             f"Guest: {booking.get_guest().get_name()}",
-            f"Room: {booking.get_room().get_room_number()} ({booking.get_room().get_room_type().get_type_name()})",
+            f"Room: {booking.get_room_label()}",
             f"Dates: {booking.get_check_in()} to {booking.get_check_out()}",
             "",
             "Charges:",
-            f"  Room ({booking.get_room().get_price():.2f}/night x {(booking.get_check_out() - booking.get_check_in()).days} nights): ${self._room_charges:.2f}",
+            f"  Room ({format_cents(booking.get_rate_cents())}/night x {booking.get_nights()} nights): ${format_cents(self._room_charges_cents)}",
         ]
         
         if booking.get_additional_services():
             invoice_lines.append("  Additional Services:")
             for service in booking.get_additional_services():
-                invoice_lines.append(f"    {service.get_name()}: ${service.get_price():.2f}")
+                invoice_lines.append(f"    {service.get_name()}: ${format_cents(service.get_price_cents())}")
         
         invoice_lines.extend([
             "",
             "Summary:",
-            f"  Room Charges: ${self._room_charges:.2f}",
-            f"  Service Charges: ${self._service_charges:.2f}",
-            f"  Tax ({self._tax_rate*100:.1f}%): ${self._tax:.2f}",
-            f"  Total: ${self._total:.2f}",
+            f"  Room Charges: ${format_cents(self._room_charges_cents)}",
+            f"  Service Charges: ${format_cents(self._service_charges_cents)}",
+            f"  Tax ({self._tax_rate_basis_points / 100:.1f}%): ${format_cents(self._tax_cents)}",
+            f"  Total: ${format_cents(self._total_cents)}",
             "",
             f"Payment Method: {self._payment.get_method()}",
             f"Payment Status: {self._payment.get_status()}",
@@ -1,4 +1,7 @@
-class Person:
+from observable import Observable
+
+
+class Person(Observable):
     """Base class representing a person with basic information"""
     
     def __init__(self, name, contact, email):
@@ -10,6 +13,7 @@ class Person:
             contact: Phone number or contact information
             email: Email address
         """
+        super().__init__()
         self._name = name
         self._contact = contact
         self._email = email
@@ -22,7 +26,9 @@ class Person:
         """Set the person's name"""
         if not isinstance(value, str) or len(value.strip()) == 0:
             raise ValueError("Name must be a non-empty string")
+        old_value = self._name
         self._name = value.strip()
+        self._notify_change("name", old_value, self._name)
     
     def get_contact(self):
         """Get the contact information"""
@@ -32,7 +38,9 @@ class Person:
         """Set the contact information"""
         if not isinstance(value, str) or len(value.strip()) == 0:
             raise ValueError("Contact must be a non-empty string")
+        old_value = self._contact
         self._contact = value.strip()
+        self._notify_change("contact", old_value, self._contact)
     
     def get_email(self):
         """Get the email address"""
@@ -42,7 +50,9 @@ class Person:
         """Set the email address"""
         if "@" not in value or "." not in value:
             raise ValueError("Invalid email format")
+        old_value = self._email
         self._email = value.strip()
+        self._notify_change("email", old_value, self._email)
     
     def __str__(self):
         """String representation of the Person"""
@@ -65,6 +75,7 @@ class Guest(Person):
         super().__init__(name, contact, email)
         self._guest_id = guest_id
         self._loyalty_points = 0
+        self._loyalty_ledger = None
         self._preferences = []
         self._reservation_history = []
     
@@ -74,21 +85,49 @@ class Guest(Person):
     
     def get_loyalty_points(self):
         """Get the loyalty points"""
+        if self._loyalty_ledger is not None:
+            return self._loyalty_ledger.get_balance(self._guest_id)
         return self._loyalty_points
     
+    def get_loyalty_ledger(self):
+        """Get the loyalty ledger keeping the guest's points (None if not on one)"""
+        return self._loyalty_ledger
+    
+    def set_loyalty_ledger(self, ledger):
+        """
+        Move the guest's points onto a loyalty ledger, which keeps them from now on
+        
+        A guest already on another ledger stays there, so registering the same
+        guest at a second hotel does not split or reset their points; stays at
+        the second hotel are accrued to that same ledger.
+        """
+        if self._loyalty_ledger is not None and self._loyalty_ledger is not ledger:
+            return
+        ledger.open_account(self._guest_id, self._loyalty_points)
+        self._loyalty_ledger = ledger
+        self._loyalty_points = 0
+    
     def add_loyalty_points(self, points):
         """Add loyalty points to the guest's account"""
         if not isinstance(points, int) or points <= 0:
             raise ValueError("Points must be a positive integer")
-        self._loyalty_points += points
+        if self._loyalty_ledger is not None:
+            self._loyalty_ledger.add_points(self._guest_id, points)
+        else:
+            self._loyalty_points += points
+            self._notify_change("loyalty_points", self._loyalty_points - points, self._loyalty_points)
     
     def redeem_loyalty_points(self, points):
         """Redeem loyalty points from the guest's account"""
         if not isinstance(points, int) or points <= 0:
             raise ValueError("Points must be a positive integer")
-        if points > self._loyalty_points:
+        if points > self.get_loyalty_points():
             raise ValueError("Not enough loyalty points")
-        self._loyalty_points -= points
+        if self._loyalty_ledger is not None:
+            self._loyalty_ledger.redeem_points(self._guest_id, points)
+        else:
+            self._loyalty_points -= points
+            self._notify_change("loyalty_points", self._loyalty_points + points, self._loyalty_points)
     
     def get_preferences(self):
         """Get the guest's preferences"""
@@ -98,19 +137,51 @@ class Guest(Person):
         """Add a preference to the guest's profile"""
         if preference not in self._preferences:
             self._preferences.append(preference)
+            self._notify_change("preferences", None, preference)
     
     def add_reservation(self, reservation):
         """Add a reservation to the guest's history"""
         self._reservation_history.append(reservation)
+        self._notify_change("reservation_history", None, reservation)
     
     def get_reservation_history(self):
-        """Get the guest's reservation history"""
-        return self._reservation_history.copy()
+        """
+        Get the guest's reservation history
+        
+        Returns:
+            List[Booking]: Bookings of the guest; bookings that are still
+            booking IDs because no hotel holding them has reloaded the guest
+            are left out (see get_reservation_ids)
+        """
+        return [r for r in self._reservation_history if not isinstance(r, str)]
+    
+    def get_reservation_ids(self):
+        """Get the booking IDs of the guest's whole reservation history"""
+        return [r if isinstance(r, str) else r.get_booking_id() for r in self._reservation_history]
+    
+    def relink_reservations(self, bookings):
+        """
+        Replace booking IDs left by unpickling with the booking objects
+        
+        Args:
+            bookings: Dict of booking ID to Booking
+        """
+        self._reservation_history = [bookings.get(r, r) if isinstance(r, str) else r
+                                     for r in self._reservation_history]
+    
+    def __getstate__(self):
+        """Pickle the guest with booking IDs in place of its bookings, and its
+        points balance in place of its ledger"""
+        state = super().__getstate__()
+        state["_reservation_history"] = self.get_reservation_ids()
+        state["_loyalty_points"] = self.get_loyalty_points()
+        state["_loyalty_ledger"] = None
+        return state
     
     def __str__(self):
         """String representation of the Guest"""
         return (f"Guest ID: {self._guest_id}, {super().__str__()}, "
-                f"Loyalty Points: {self._loyalty_points}")
+                f"Loyalty Points: {self.get_loyalty_points()}")
 
 
 class Staff(Person):
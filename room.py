@@ -1,4 +1,8 @@
 from datetime import date, timedelta
+from array import array
+from observable import Observable
+from days import to_day, to_date
+from money import to_cents, from_cents, format_cents
 
 class RoomType:
     """Class representing types of rooms available"""
@@ -33,7 +37,7 @@ class RoomType:
         return f"{self._type_name} Room (Capacity: {self._capacity}): {self._description}"
 
 
-class Room:
+class Room(Observable):
     """Class representing a hotel room"""
     
     def __init__(self, room_number, room_type, amenities, price):
@@ -46,12 +50,18 @@ class Room:
             amenities: List of amenities
             price: Price per night
         """
+        super().__init__()
         self._room_number = room_number
         self._room_type = room_type
         self._amenities = amenities.copy()
-        self._price = price
+        self._price_cents = to_cents(price)
         self._is_available = True
-        self._booked_dates = []
+        # Stays are kept as day ordinals: parallel arrays of check-in and
+        # check-out days, and one byte per night from _calendar_start (1 = booked)
+        self._stay_starts = array("l")
+        self._stay_ends = array("l")
+        self._calendar_start = 0
+        self._nights = bytearray()
     
     def get_room_number(self):
         """Get the room number"""
@@ -77,13 +87,19 @@ class Room:
     
     def get_price(self):
         """Get the room price per night"""
-        return self._price
+        return from_cents(self._price_cents)
+    
+    def get_price_cents(self):
+        """Get the room price per night in cents"""
+        return self._price_cents
     
     def set_price(self, value):
         """Set the room price per night"""
         if not isinstance(value, (int, float)) or value <= 0:
             raise ValueError("Price must be a positive number")
-        self._price = float(value)
+        old_value = self._price_cents
+        self._price_cents = to_cents(value)
+        self._notify_change("price", old_value, self._price_cents)
     
     def is_available(self):
         """Check if the room is currently available"""
@@ -100,13 +116,25 @@ class Room:
         Returns:
             bool: True if available, False otherwise
         """
-        if check_in >= check_out:
-            raise ValueError("Check-in date must be before check-out date")
+        return self.check_days(to_day(check_in), to_day(check_out))
+    
+    def check_days(self, first_day, last_day):
+        """
+        Check if the room is free from one day ordinal up to (not including) another
+        
+        Args:
+            first_day: Check-in day ordinal
+            last_day: Check-out day ordinal
             
-        for booked_in, booked_out in self._booked_dates:
-            if not (check_out <= booked_in or check_in >= booked_out):
-                return False
-        return True
+        Returns:
+            bool: True if available, False otherwise
+        """
+        if first_day >= last_day:
+            raise ValueError("Check-in date must be before check-out date")
+        
+        start = max(first_day - self._calendar_start, 0)
+        end = min(last_day - self._calendar_start, len(self._nights))
+        return start >= end or self._nights.find(1, start, end) == -1
     
     def book_room(self, check_in, check_out):
         """
@@ -116,19 +144,77 @@ class Room:
             check_in: Check-in date
             check_out: Check-out date
         """
-        if not self.check_availability(check_in, check_out):
+        self.book_days(to_day(check_in), to_day(check_out))
+    
+    def book_days(self, first_day, last_day):
+        """Book the room from one day ordinal up to (not including) another"""
+        if not self.check_days(first_day, last_day):
             raise ValueError("Room not available for the selected dates")
         
-        self._booked_dates.append((check_in, check_out))
+        if not self._nights:
+            self._calendar_start = first_day
+        elif first_day < self._calendar_start:
+            self._nights[0:0] = bytes(self._calendar_start - first_day)
+            self._calendar_start = first_day
+        end = last_day - self._calendar_start
+        if end > len(self._nights):
+            self._nights.extend(bytes(end - len(self._nights)))
+        self._nights[first_day - self._calendar_start:end] = b"\x01" * (last_day - first_day)
+        self._stay_starts.append(first_day)
+        self._stay_ends.append(last_day)
         self._is_available = False
     
-    def release_room(self):
-        """Mark the room as available"""
+    def release_room(self, check_in=None, check_out=None):
+        """
+        Mark the room as available, freeing the dates of a cancelled booking
+        
+        Args:
+            check_in: Check-in date of the booking being released
+            check_out: Check-out date of the booking being released
+        """
+        if check_in is not None and check_out is not None:
+            self.release_days(to_day(check_in), to_day(check_out))
         self._is_available = True
     
+    def release_days(self, first_day, last_day):
+        """Free a booked stay given by its check-in and check-out day ordinals"""
+        for index, (start, end) in enumerate(zip(self._stay_starts, self._stay_ends)):
+            if start == first_day and end == last_day:
+                del self._stay_starts[index]
+                del self._stay_ends[index]
+                offset = self._calendar_start
+                self._nights[first_day - offset:last_day - offset] = bytes(last_day - first_day)
+                return
+    
+    def get_booked_dates(self):
+        """Get the booked (check-in, check-out) date ranges"""
+        return [(to_date(start), to_date(end))
+                for start, end in zip(self._stay_starts, self._stay_ends)]
+    
+    def get_booked_days(self):
+        """Get the booked (check-in, check-out) day ordinal ranges"""
+        return list(zip(self._stay_starts, self._stay_ends))
+    
+    def get_free_window(self, check_in, check_out):
+        """
+        Get the free gap around a date range, bounded by the neighbouring bookings
+        
+        Args:
+            check_in: Check-in date
+            check_out: Check-out date
+            
+        Returns:
+            tuple: (start, end) of the gap, None meaning unbounded
+        """
+        first_day, last_day = to_day(check_in), to_day(check_out)
+        start = max((end for end in self._stay_ends if end <= first_day), default=None)
+        end = min((start for start in self._stay_starts if start >= last_day), default=None)
+        return (to_date(start) if start is not None else None,
+                to_date(end) if end is not None else None)
+    
     def __str__(self):
         """String representation of the Room"""
         status = "Available" if self._is_available else "Booked"
         return (f"Room {self._room_number} - {self._room_type.get_type_name()} "
-                f"(Price: ${self._price:.2f}/night, Status: {status}) "
+                f"(Price: ${format_cents(self._price_cents)}/night, Status: {status}) "
                 f"Amenities: {', '.join(self._amenities)}")
\ No newline at end of file
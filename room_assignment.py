@@ -0,0 +1,159 @@
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from datetime import date
+from days import to_day
+
+OPTIMIZE_HORIZON_DAYS = 90
+
+
+def measure_fragmentation(stays_by_room, first_day, last_day):
+    """
+    Measure how broken up the free nights of a set of rooms are
+    
+    Args:
+        stays_by_room: One list of (check-in day, check-out day) ordinals per room
+        first_day: First day ordinal of the window
+        last_day: Day ordinal after the last night of the window
+    
+    Returns:
+        dict: "free_nights", "gaps" (runs of consecutive free nights) and
+        "longest_gap" (nights in the longest run) within the window
+    """
+    free_nights = gaps = longest_gap = 0
+    for stays in stays_by_room:
+        cursor = first_day
+        for start, end in sorted(stays):
+            if start >= last_day:
+                break
+            if start > cursor:
+                gaps += 1
+                free_nights += start - cursor
+                longest_gap = max(longest_gap, start - cursor)
+            cursor = max(cursor, end)
+        if cursor < last_day:
+            gaps += 1
+            free_nights += last_day - cursor
+            longest_gap = max(longest_gap, last_day - cursor)
+    return {"free_nights": free_nights, "gaps": gaps, "longest_gap": longest_gap}
+
+
+class RoomAssignmentOptimizer:
+    """Reassigns future bookings among rooms of a type to keep free nights contiguous"""
+    
+    def __init__(self, horizon=OPTIMIZE_HORIZON_DAYS):
+        """
+        Initialize a RoomAssignmentOptimizer object
+        
+        Args:
+            horizon: Number of days ahead whose arrivals may be moved
+        """
+        self._horizon = horizon
+    
+    def optimize(self, rooms, bookings, today=None):
+        """
+        Plan room moves for confirmed bookings that have not arrived yet
+        
+        Rooms are treated as colors of an interval graph: bookings are taken
+        in order of arrival (longest first on ties) and each goes to the room
+        that became free latest before its check-in (best fit), so stays pack
+        back to back and untouched rooms stay free. Stays that cannot move
+        (arrived guests, bookings beyond the horizon) are placed first. A
+        room type's plan is only kept if it leaves fewer, longer free runs.
+        
+        Args:
+            rooms: Rooms of the hotel
+            bookings: All bookings
+            today: Date of the optimization (defaults to today)
+        
+        Returns:
+            dict: Room type name -> {"moves": list of (booking, new room),
+            "before", "after"}, with fragmentation measured over the horizon
+            (see measure_fragmentation)
+        """
+        base = to_day(today or date.today())
+        window_end = base + self._horizon
+        
+        rooms_by_type, movable_by_type = {}, {}
+        for room in rooms:
+            rooms_by_type.setdefault(room.get_room_type().get_type_name(), []).append(room)
+        for booking in bookings:
+            if (booking.get_status() == "Confirmed" and booking.get_room() is not None
+                    and base < booking.get_check_in_day() < window_end):
+                type_name = booking.get_room().get_room_type().get_type_name()
+                movable_by_type.setdefault(type_name, []).append(booking)
+        
+        plans = {}
+        for type_name, rooms_of_type in rooms_by_type.items():
+            plans[type_name] = self._plan_type(rooms_of_type, movable_by_type.get(type_name, []),
+                                               base, window_end)
+        return plans
+    
+    def _plan_type(self, rooms, movable, base, window_end):
+        """Plan the moves within one room type"""
+        index_of = {id(room): index for index, room in enumerate(rooms)}
+        current = [room.get_booked_days() for room in rooms]
+        before = measure_fragmentation(current, base, window_end)
+        
+        # Whatever is not being moved stays where it is
+        moving = [Counter() for _ in rooms]
+        for booking in movable:
+            moving[index_of[id(booking.get_room())]][(booking.get_check_in_day(),
+                                                      booking.get_check_out_day())] += 1
+        fixed = []
+        for index, stays in enumerate(current):
+            for stay in stays:
+                if moving[index][stay]:
+                    moving[index][stay] -= 1
+                else:
+                    fixed.append((stay[0], 0, stay[1], index))
+        fixed_starts = [[] for _ in rooms]
+        for start, _, _, index in sorted(fixed):
+            fixed_starts[index].append(start)
+        
+        # Sweep stays by check-in; fixed stays go first on ties so they keep their room
+        sweep = fixed + [(b.get_check_in_day(), 1, -b.get_nights(), position)
+                         for position, b in enumerate(movable)]
+        sweep.sort()
+        free_from = [0] * len(rooms)
+        by_free_from = [(0, index) for index in range(len(rooms))]
+        planned = [[] for _ in rooms]
+        for start, _, end, index in fixed:
+            planned[index].append((start, end))
+        
+        def fits(index, start, end):
+            starts = fixed_starts[index]
+            following = bisect_right(starts, start)
+            return free_from[index] <= start and (following == len(starts) or starts[following] >= end)
+        
+        def occupy(index, end):
+            del by_free_from[bisect_left(by_free_from, (free_from[index], index))]
+            free_from[index] = max(free_from[index], end)
+            insort(by_free_from, (free_from[index], index))
+        
+        moves = []
+        for start, kind, end_or_length, index in sweep:
+            if kind == 0:
+                occupy(index, end_or_length)
+                continue
+            booking = movable[index]
+            end = booking.get_check_out_day()
+            position = bisect_right(by_free_from, (start, len(rooms))) - 1
+            while position >= 0 and not fits(by_free_from[position][1], start, end):
+                position -= 1
+            if position < 0:
+                # Cannot be placed without disturbing fixed stays; leave the type as is
+                return {"moves": [], "before": before, "after": before}
+            chosen = by_free_from[position][1]
+            # Among equally good rooms, keep the booking where it is
+            own = index_of[id(booking.get_room())]
+            if own != chosen and free_from[own] == free_from[chosen] and fits(own, start, end):
+                chosen = own
+            occupy(chosen, end)
+            planned[chosen].append((start, end))
+            if chosen != own:
+                moves.append((booking, rooms[chosen]))
+        
+        after = measure_fragmentation(planned, base, window_end)
+        if (after["gaps"], -after["longest_gap"]) >= (before["gaps"], -before["longest_gap"]):
+            return {"moves": [], "before": before, "after": before}
+        return {"moves": moves, "before": before, "after": after}
\ No newline at end of file
@@ -1,7 +1,18 @@
-class Service:
+import time
+from observable import Observable
+from money import to_cents, from_cents, format_cents
+
+# Service request priorities, most urgent first
+PRIORITY_URGENT = 0
+PRIORITY_HIGH = 1
+PRIORITY_NORMAL = 2
+PRIORITY_LOW = 3
+
+
+class Service(Observable):
     """Class representing a hotel service"""
     
-    def __init__(self, service_id, name, price):
+    def __init__(self, service_id, name, price, department=None):
         """
         Initialize a Service object
         
@@ -9,10 +20,13 @@ class Service:
             service_id: Unique service identifier
             name: Name of the service
             price: Price of the service
+            department: Staff department that fulfills requests for the service
         """
+        super().__init__()
         self._service_id = service_id
         self._name = name
-        self._price = price
+        self._price_cents = to_cents(price)
+        self._department = department
         self._is_available = True
     
     def get_service_id(self):
@@ -25,13 +39,23 @@ class Service:
     
     def get_price(self):
         """Get the service price"""
-        return self._price
+        return from_cents(self._price_cents)
+    
+    def get_price_cents(self):
+        """Get the service price in cents"""
+        return self._price_cents
     
     def set_price(self, value):
         """Set the service price"""
         if not isinstance(value, (int, float)) or value <= 0:
             raise ValueError("Price must be a positive number")
-        self._price = float(value)
+        old_value = self._price_cents
+        self._price_cents = to_cents(value)
+        self._notify_change("price", old_value, self._price_cents)
+    
+    def get_department(self):
+        """Get the department that fulfills the service"""
+        return self._department
     
     def is_available(self):
         """Check if the service is available"""
@@ -39,29 +63,41 @@ class Service:
     
     def set_availability(self, available):
         """Set the availability of the service"""
+        old_value = self._is_available
         self._is_available = available
+        if old_value != available:
+            self._notify_change("availability", old_value, available)
     
     def __str__(self):
         """String representation of the Service"""
         status = "Available" if self._is_available else "Unavailable"
-        return f"Service {self._service_id}: {self._name} (${self._price:.2f}) - {status}"
+        return f"Service {self._service_id}: {self._name} (${format_cents(self._price_cents)}) - {status}"
 
 
-class ServiceRequest:
+class ServiceRequest(Observable):
     """Class representing a guest's service request"""
     
-    def __init__(self, guest, service):
+    def __init__(self, guest, service, priority=PRIORITY_NORMAL, guest_lookup=None):
         """
         Initialize a ServiceRequest object
         
         Args:
             guest: Guest making the request
             service: Service being requested
+            priority: Priority, from PRIORITY_URGENT (0) to PRIORITY_LOW (3)
+            guest_lookup: Callable returning a guest by ID; when given, only the
+                guest ID is kept, so guest profiles can be evicted from memory
         """
+        super().__init__()
         self._request_id = self._generate_request_id()
-        self._guest = guest
+        self._guest_id = guest.get_guest_id()
+        self._guest_lookup = guest_lookup
+        self._guest = guest if guest_lookup is None else None
         self._service = service
+        self._priority = priority
         self._status = "Pending"
+        self._assigned_staff = None
+        self._created_at = time.time()
     
     def _generate_request_id(self):
         """Generate a unique request ID"""
@@ -76,8 +112,14 @@ class ServiceRequest:
     
     def get_guest(self):
         """Get the guest"""
+        if self._guest_lookup is not None:
+            return self._guest_lookup(self._guest_id)
         return self._guest
     
+    def get_guest_id(self):
+        """Get the ID of the guest"""
+        return self._guest_id
+    
     def get_service(self):
         """Get the service"""
         return self._service
@@ -86,17 +128,45 @@ class ServiceRequest:
         """Get the request status"""
         return self._status
     
+    def get_priority(self):
+        """Get the request priority"""
+        return self._priority
+    
+    def get_created_at(self):
+        """Get the time the request was created (seconds since the epoch)"""
+        return self._created_at
+    
+    def get_assigned_staff(self):
+        """Get the staff member assigned to the request"""
+        return self._assigned_staff
+    
+    def assign_to(self, staff):
+        """Assign the request to a staff member"""
+        if self._status != "Pending":
+            raise ValueError("Only pending requests can be assigned")
+        self._assigned_staff = staff
+        self._set_status("Assigned")
+    
     def fulfill_request(self):
         """Mark the request as fulfilled"""
-        self._status = "Fulfilled"
+        self._set_status("Fulfilled")
     
     def cancel_request(self):
         """Cancel the request"""
-        self._status = "Cancelled"
+        self._set_status("Cancelled")
+    
+    def _set_status(self, value):
+        """Change the status and notify listeners"""
+        old_value = self._status
+        self._status = value
+        if old_value != value:
+            self._notify_change("status", old_value, value)
     
     def __str__(self):
         """String representation of the ServiceRequest"""
+        assigned = self._assigned_staff.get_name() if self._assigned_staff else "Unassigned"
         return (f"Request ID: {self._request_id}\n"
-                f"Guest: {self._guest.get_name()}\n"
+                f"Guest: {self.get_guest().get_name()}\n"
                 f"Service: {self._service.get_name()}\n"
-                f"Status: {self._status}")
\ No newline at end of file
+                f"Status: {self._status}\n"
+                f"Assigned To: {assigned}")
\ No newline at end of file
@@ -0,0 +1,291 @@
+import gc
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from hotel import Hotel
+from person import Guest, Staff
+from room import Room, RoomType
+from service import Service
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+DEFAULT_MIX = {
+    "search": 0.35,
+    "booking": 0.20,
+    "add_service": 0.10,
+    "payment": 0.10,
+    "cancel": 0.05,
+    "service_request": 0.12,
+    "service_fulfill": 0.08,
+}
+
+
+def build_hotel(rooms=200, guests=2000, seed=0):
+    """
+    Build a hotel populated with rooms, guests, staff and services for simulation
+    
+    Args:
+        rooms: Number of rooms
+        guests: Number of guests
+        seed: Seed for the generated prices
+    
+    Returns:
+        Hotel: The populated hotel
+    """
+    rng = random.Random(seed)
+    hotel = Hotel("Simulated Hotel")
+    room_types = [
+        (RoomType("Single", "Single bed room", 1), 90),
+        (RoomType("Double", "Double bed room", 2), 140),
+        (RoomType("Suite", "Luxury suite with living area", 4), 290),
+    ]
+    for room_type, _ in room_types:
+        hotel.add_room_type(room_type)
+    for number in range(rooms):
+        room_type, base_price = room_types[number % len(room_types)]
+        hotel.add_room(Room(f"{100 + number}", room_type, ["Wi-Fi", "TV"],
+                            base_price + rng.randint(0, 20) - 0.01))
+    for number, (name, price) in enumerate([("Room Service", 15.99), ("Laundry", 9.99),
+                                            ("Airport Transfer", 29.99), ("Spa", 59.99)]):
+        hotel.add_service(Service(f"SRV{number + 1:03d}", name, price))
+    for number in range(guests):
+        hotel.add_guest(Guest(f"Guest {number}", f"555-{number:06d}",
+                              f"guest{number}@email.com", f"G{number:06d}"))
+    for number in range(max(rooms // 20, 1)):
+        hotel.add_staff(Staff(f"Staff {number}", f"555-9{number:05d}", f"staff{number}@hotel.com",
+                              f"S{number:04d}", "Attendant", "Front Desk"))
+    return hotel
+
+
+def _current_rss():
+    """Get the current resident set size in KiB, or None where /proc is not available"""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+class _Skipped(Exception):
+    """Raised when the simulator has nothing to send to the hotel for an operation"""
+
+
+class WorkloadSimulator:
+    """Deterministic workload driving a Hotel through its public API over simulated days"""
+    
+    def __init__(self, hotel=None, seed=0, ops_per_day=500, mix=None, start_date=None,
+                 memory_sample_days=7, guest_ids=None):
+        """
+        Initialize a WorkloadSimulator object
+        
+        Args:
+            hotel: Hotel to drive (defaults to build_hotel())
+            seed: Seed that fixes the sequence of operations
+            ops_per_day: Operations issued per simulated day
+            mix: Dict of operation name to relative weight (defaults to DEFAULT_MIX)
+            start_date: First simulated day (defaults to today)
+            memory_sample_days: Simulated days between memory samples (0 disables sampling)
+            guest_ids: IDs of the guests to book for (defaults to all of the hotel's guests)
+        """
+        mix = mix or DEFAULT_MIX
+        unknown = set(mix) - set(DEFAULT_MIX)
+        if unknown:
+            raise ValueError(f"Unknown operations: {', '.join(sorted(unknown))}")
+        self._hotel = hotel or build_hotel(seed=seed)
+        self._rng = random.Random(seed)
+        self._ops_per_day = ops_per_day
+        self._operations = list(mix)
+        self._weights = [mix[op] for op in self._operations]
+        self._start_date = start_date or date.today()
+        self._memory_sample_days = memory_sample_days
+        self._room_numbers = [r.get_room_number() for r in self._hotel.get_rooms()]
+        self._guest_ids = list(guest_ids or self._hotel.get_guest_ids())
+        self._service_ids = [s.get_service_id() for s in self._hotel.get_services()]
+        self._staff_ids = [s.get_staff_id() for s in self._hotel.get_staff()]
+        if not (self._room_numbers and self._guest_ids and self._service_ids and self._staff_ids):
+            raise ValueError("Hotel needs rooms, guests, services and staff to simulate")
+        self._active_bookings = []
+        self._unpaid_bookings = []
+    
+    def run(self, days=90):
+        """
+        Run the workload for a number of simulated days
+        
+        Only calls that reach the hotel are timed. Operations the simulator
+        has nothing to send for (e.g. no booking to pay) are counted as
+        skipped. Memory is sampled before the first day, between simulated
+        days and after the last day, outside the timed operations, so
+        sampling does not skew throughput or latency.
+        
+        Args:
+            days: Number of simulated days
+        
+        Returns:
+            dict: "operations", "elapsed", "ops_per_sec", "latency" (per operation:
+            count, rejected, skipped, p50, p95, p99 in milliseconds) and
+            "memory" (list of (label, live objects, current RSS, peak RSS),
+            with RSS in KiB or None; labelled "start", a simulated date, or
+            "end")
+        """
+        latencies = {op: [] for op in self._operations}
+        rejected = dict.fromkeys(self._operations, 0)
+        skipped = dict.fromkeys(self._operations, 0)
+        sampling = self._memory_sample_days > 0
+        memory = [("start", *self._sample_memory())] if sampling else []
+        
+        elapsed = 0.0
+        for offset in range(days):
+            today = self._start_date + timedelta(days=offset)
+            operations = self._rng.choices(self._operations, self._weights, k=self._ops_per_day)
+            for op in operations:
+                call = getattr(self, f"_op_{op}")
+                op_started = time.perf_counter()
+                try:
+                    call(today)
+                except _Skipped:
+                    skipped[op] += 1
+                    continue
+                except ValueError:
+                    rejected[op] += 1
+                duration = time.perf_counter() - op_started
+                elapsed += duration
+                latencies[op].append(duration)
+            if sampling and offset % self._memory_sample_days == 0:
+                memory.append((today, *self._sample_memory()))
+        if sampling:
+            memory.append(("end", *self._sample_memory()))
+        
+        total = sum(len(samples) for samples in latencies.values())
+        return {
+            "operations": total,
+            "elapsed": elapsed,
+            "ops_per_sec": total / elapsed if elapsed else 0.0,
+            "latency": {op: self._summarize(samples, rejected[op], skipped[op])
+                        for op, samples in latencies.items()},
+            "memory": memory,
+        }
+    
+    def _sample_memory(self):
+        """Get the number of live objects tracked by the collector, and the current
+        and peak RSS in KiB"""
+        gc.collect()
+        peak_rss = None
+        if resource is not None:
+            peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            if sys.platform == "darwin":
+                # ru_maxrss is in bytes on macOS and KiB elsewhere
+                peak_rss //= 1024
+        return len(gc.get_objects()), _current_rss(), peak_rss
+    
+    def _summarize(self, samples, rejected, skipped):
+        """Summarize latency samples (seconds) as millisecond percentiles"""
+        ordered = sorted(samples)
+        
+        def percentile(fraction):
+            if not ordered:
+                return 0.0
+            return ordered[int(fraction * (len(ordered) - 1))] * 1000
+        
+        return {
+            "count": len(ordered),
+            "rejected": rejected,
+            "skipped": skipped,
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+        }
+    
+    def _random_stay(self, today):
+        """Pick a check-in and check-out date a realistic lead time ahead"""
+        check_in = today + timedelta(days=int(self._rng.expovariate(1 / 21)))
+        return check_in, check_in + timedelta(days=self._rng.randint(1, 7))
+    
+    def _op_search(self, today):
+        """Search for available rooms"""
+        check_in, check_out = self._random_stay(today)
+        room_type = self._rng.choice([None, "Single", "Double", "Suite"])
+        self._hotel.find_available_rooms(check_in, check_out, room_type)
+    
+    def _op_booking(self, today):
+        """Book a random room for a random guest"""
+        check_in, check_out = self._random_stay(today)
+        booking = self._hotel.make_booking(self._rng.choice(self._guest_ids),
+                                           self._rng.choice(self._room_numbers),
+                                           check_in, check_out, today)
+        self._active_bookings.append(booking)
+        self._unpaid_bookings.append(booking)
+    
+    def _op_add_service(self, today):
+        """Add a service to a random active booking"""
+        booking = self._pick(self._active_bookings)
+        self._hotel.add_service_to_booking(booking.get_booking_id(), self._rng.choice(self._service_ids))
+    
+    def _op_payment(self, today):
+        """Pay for a random unpaid booking"""
+        booking = self._pick(self._unpaid_bookings, remove=True)
+        if booking.get_status() == "Cancelled":
+            raise _Skipped("Booking was cancelled")
+        self._hotel.process_payment(booking.get_booking_id(), booking.get_total_cost(),
+                                    self._rng.choice(["Credit Card", "Debit Card", "Cash"]))
+    
+    def _op_cancel(self, today):
+        """Cancel a random active booking"""
+        booking = self._pick(self._active_bookings, remove=True)
+        self._hotel.cancel_booking(booking.get_booking_id())
+    
+    def _op_service_request(self, today):
+        """Create a service request for a random guest"""
+        self._hotel.create_service_request(self._rng.choice(self._guest_ids),
+                                           self._rng.choice(self._service_ids))
+    
+    def _op_service_fulfill(self, today):
+        """Have a random staff member claim and fulfill the next request"""
+        request = self._hotel.claim_service_request(self._rng.choice(self._staff_ids))
+        if request is None:
+            raise _Skipped("No pending service requests")
+        self._hotel.fulfill_service_request(request.get_request_id())
+    
+    def _pick(self, bookings, remove=False):
+        """Pick a random booking from a list, optionally removing it in O(1)"""
+        if not bookings:
+            raise _Skipped("No bookings to choose from")
+        index = self._rng.randrange(len(bookings))
+        booking = bookings[index]
+        if remove:
+            bookings[index] = bookings[-1]
+            bookings.pop()
+        return booking
+
+
+def _format_kib(kib):
+    """Format a size in KiB as MiB, or n/a if unknown"""
+    return f"{kib / 1024:.1f} MiB" if kib is not None else "n/a"
+
+
+def format_report(report):
+    """Format a simulation report as readable text"""
+    lines = [
+        f"Operations: {report['operations']} in {report['elapsed']:.2f}s "
+        f"({report['ops_per_sec']:.0f} ops/sec)",
+        "Latency (ms):",
+    ]
+    for op, stats in report["latency"].items():
+        lines.append(f"  {op:<16} n={stats['count']:<6} rejected={stats['rejected']:<6} "
+                     f"skipped={stats['skipped']:<6} p50={stats['p50']:.3f} p95={stats['p95']:.3f} p99={stats['p99']:.3f}")
+    if report["memory"]:
+        lines.append("Memory:")
+        for label, objects, rss, peak_rss in report["memory"]:
+            lines.append(f"  {label}: {objects} objects, RSS {_format_kib(rss)}, "
+                         f"peak RSS {_format_kib(peak_rss)}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(format_report(WorkloadSimulator(seed=42).run(days=90)))
\ No newline at end of file
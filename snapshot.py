@@ -0,0 +1,227 @@
+import threading
+import weakref
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
+
+BookingRecord = namedtuple("BookingRecord", [
+    "booking_id", "guest_id", "room_number", "check_in", "check_out",
+    "status", "total_cost_cents", "service_ids", "posted_cents",
+])
+PaymentRecord = namedtuple("PaymentRecord", [
+    "payment_id", "booking_id", "amount_cents", "method", "status",
+])
+RoomRecord = namedtuple("RoomRecord", [
+    "room_number", "type_name", "price_cents", "booked_dates",
+])
+
+
+def booking_record(booking):
+    """Get an immutable record of a booking's current state"""
+    return BookingRecord(
+        booking.get_booking_id(),
+        booking.get_guest_id(),
+        booking.get_room().get_room_number() if booking.get_room() is not None else None,
+        booking.get_check_in(),
+        booking.get_check_out(),
+        booking.get_status(),
+        booking.get_total_cost_cents(),
+        tuple(s.get_service_id() for s in booking.get_additional_services()),
+        booking.get_posted_charges_cents(),
+    )
+
+
+def payment_record(payment):
+    """Get an immutable record of a payment's current state"""
+    return PaymentRecord(
+        payment.get_payment_id(),
+        payment.get_booking().get_booking_id(),
+        payment.get_amount_cents(),
+        payment.get_method(),
+        payment.get_status(),
+    )
+
+
+def room_record(room):
+    """Get an immutable record of a room and its booked dates"""
+    return RoomRecord(
+        room.get_room_number(),
+        room.get_room_type().get_type_name(),
+        room.get_price_cents(),
+        tuple(sorted(room.get_booked_dates())),
+    )
+
+
+class VersionedMap:
+    """Map keeping every record version still visible to a live snapshot"""
+    
+    def __init__(self):
+        """Initialize an empty VersionedMap"""
+        self._keys = []
+        self._chains = {}
+    
+    def put(self, key, record, version, live_versions):
+        """
+        Store a new version of a record (called with the lock held)
+        
+        Args:
+            key: Record key
+            record: Immutable record
+            version: Version number of the write
+            live_versions: Sorted versions of the snapshots still alive
+        """
+        chain = self._chains.get(key)
+        if chain is None:
+            self._keys.append(key)
+            self._chains[key] = [(version, record)]
+            return
+        # Only the versions some live snapshot reads are kept; the list is
+        # replaced rather than edited so readers in other threads are unaffected
+        kept = []
+        for index, (written, _) in enumerate(chain):
+            superseded = chain[index + 1][0] if index + 1 < len(chain) else version
+            # Visible to a snapshot taken at or after the write, before it was superseded
+            position = bisect_left(live_versions, written)
+            if position < len(live_versions) and live_versions[position] < superseded:
+                kept.append(chain[index])
+        self._chains[key] = kept + [(version, record)]
+    
+    def get(self, key, version):
+        """Get the record of a key as of a version, or None"""
+        chain = self._chains.get(key)
+        if chain is None:
+            return None
+        position = bisect_right(chain, (version + 1, )) - 1
+        return chain[position][1] if position >= 0 else None
+    
+    def iter_records(self, version, key_count):
+        """Iterate over the records of the first key_count keys as of a version"""
+        for index in range(key_count):
+            record = self.get(self._keys[index], version)
+            if record is not None:
+                yield record
+    
+    def get_key_count(self):
+        """Get the number of keys ever stored"""
+        return len(self._keys)
+
+
+class HotelSnapshot:
+    """Immutable point-in-time view of bookings, payments and room calendars"""
+    
+    def __init__(self, store, version, booking_count, payment_count, room_count):
+        """
+        Initialize a HotelSnapshot object (use SnapshotStore.take_snapshot)
+        
+        Args:
+            store: SnapshotStore the snapshot reads from
+            version: Last write version visible in the snapshot
+            booking_count: Number of booking keys visible
+            payment_count: Number of payment keys visible
+            room_count: Number of room keys visible
+        """
+        self._store = store
+        self._version = version
+        self._booking_count = booking_count
+        self._payment_count = payment_count
+        self._room_count = room_count
+    
+    def get_version(self):
+        """Get the version of the snapshot"""
+        return self._version
+    
+    def get_booking(self, booking_id):
+        """Get a booking record as of the snapshot, or None"""
+        return self._store._bookings.get(booking_id, self._version)
+    
+    def get_payment(self, payment_id):
+        """Get a payment record as of the snapshot, or None"""
+        return self._store._payments.get(payment_id, self._version)
+    
+    def get_room(self, room_number):
+        """Get a room record, with its booked dates, as of the snapshot, or None"""
+        return self._store._rooms.get(room_number, self._version)
+    
+    def iter_bookings(self):
+        """Iterate over the booking records of the snapshot"""
+        return self._store._bookings.iter_records(self._version, self._booking_count)
+    
+    def iter_payments(self):
+        """Iterate over the payment records of the snapshot"""
+        return self._store._payments.iter_records(self._version, self._payment_count)
+    
+    def iter_rooms(self):
+        """Iterate over the room records of the snapshot"""
+        return self._store._rooms.iter_records(self._version, self._room_count)
+    
+    def export(self):
+        """
+        Copy the snapshot into plain tuples, e.g. to pickle it for another process
+        
+        Returns:
+            dict: "version", "bookings", "payments" and "rooms"
+        """
+        return {
+            "version": self._version,
+            "bookings": list(self.iter_bookings()),
+            "payments": list(self.iter_payments()),
+            "rooms": list(self.iter_rooms()),
+        }
+
+
+class SnapshotStore:
+    """Versioned copy-on-write store of booking, payment and room records"""
+    
+    def __init__(self):
+        """Initialize an empty SnapshotStore"""
+        self._lock = threading.Lock()
+        self._version = 0
+        self._bookings = VersionedMap()
+        self._payments = VersionedMap()
+        self._rooms = VersionedMap()
+        self._live_snapshots = weakref.WeakSet()
+    
+    def record(self, bookings=(), payments=(), rooms=()):
+        """
+        Store the current state of everything one change touched as a single version
+        
+        Snapshots see either all of these records or none of them, so a
+        cancelled booking never shows up next to its unrefunded payment.
+        
+        Args:
+            bookings: Bookings to record
+            payments: Payments to record
+            rooms: Rooms to record, with their calendars
+        """
+        writes = ([(self._bookings, b.get_booking_id(), booking_record(b)) for b in bookings]
+                  + [(self._payments, p.get_payment_id(), payment_record(p)) for p in payments]
+                  + [(self._rooms, r.get_room_number(), room_record(r)) for r in rooms])
+        with self._lock:
+            self._version += 1
+            live_versions = sorted(set(s.get_version() for s in self._live_snapshots))
+            for versioned_map, key, record in writes:
+                versioned_map.put(key, record, self._version, live_versions)
+    
+    def record_booking(self, booking):
+        """Store the current state of a booking"""
+        self.record(bookings=[booking])
+    
+    def record_payment(self, payment):
+        """Store the current state of a payment"""
+        self.record(payments=[payment])
+    
+    def record_room(self, room):
+        """Store the current state of a room and its calendar"""
+        self.record(rooms=[room])
+    
+    def take_snapshot(self):
+        """
+        Take a point-in-time snapshot; O(1), nothing is copied
+        
+        Returns:
+            HotelSnapshot: The snapshot
+        """
+        with self._lock:
+            snapshot = HotelSnapshot(self, self._version, self._bookings.get_key_count(),
+                                     self._payments.get_key_count(), self._rooms.get_key_count())
+            self._live_snapshots.add(snapshot)
+        return snapshot
\ No newline at end of file
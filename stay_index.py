@@ -0,0 +1,96 @@
+from datetime import timedelta
+from days import to_day
+
+
+class StayIndex:
+    """Date-bucketed index of bookings by arrival, departure and in-house night"""
+    
+    def __init__(self):
+        """Initialize empty date buckets, keyed by day ordinal"""
+        self._arrivals = {}
+        self._departures = {}
+        self._in_house = {}
+    
+    def add_booking(self, booking):
+        """
+        Add a booking to the arrival, departure and in-house buckets
+        
+        Args:
+            booking: Booking to index
+        """
+        booking_id = booking.get_booking_id()
+        first_night = booking.get_check_in_day()
+        last_day = booking.get_check_out_day()
+        self._arrivals.setdefault(first_night, {})[booking_id] = booking
+        self._departures.setdefault(last_day, {})[booking_id] = booking
+        for day in range(first_night, last_day):
+            self._in_house.setdefault(day, {})[booking_id] = booking
+    
+    def remove_booking(self, booking):
+        """Remove a booking from every bucket it is in"""
+        booking_id = booking.get_booking_id()
+        first_night = booking.get_check_in_day()
+        last_day = booking.get_check_out_day()
+        self._discard(self._arrivals, first_night, booking_id)
+        self._discard(self._departures, last_day, booking_id)
+        for day in range(first_night, last_day):
+            self._discard(self._in_house, day, booking_id)
+    
+    def get_arrivals(self, day):
+        """Get the bookings checking in on a date"""
+        return list(self._arrivals.get(to_day(day), {}).values())
+    
+    def get_departures(self, day):
+        """Get the bookings checking out on a date"""
+        return list(self._departures.get(to_day(day), {}).values())
+    
+    def get_departures_between(self, first_day, last_day):
+        """
+        Get the bookings checking out over a range of days
+        
+        Args:
+            first_day: Day ordinal of the first departure day, or None for the
+                earliest departure indexed
+            last_day: Day ordinal of the last departure day (inclusive)
+        
+        Returns:
+            List[Booking]: Bookings in order of check-out
+        """
+        if first_day is None:
+            days = sorted(day for day in self._departures if day <= last_day)
+        else:
+            days = range(first_day, last_day + 1)
+        return [booking for day in days for booking in self._departures.get(day, {}).values()]
+    
+    def get_in_house(self, day):
+        """Get the bookings staying the night of a date"""
+        return list(self._in_house.get(to_day(day), {}).values())
+    
+    def iter_turnovers(self, start, days):
+        """
+        Stream room turnovers day by day, for the housekeeping schedule
+        
+        Args:
+            start: First date to report
+            days: Number of days to report
+        
+        Yields:
+            tuple: (date, room, departing booking, arriving booking or None)
+        """
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            arrivals_by_room = {b.get_room().get_room_number(): b
+                                for b in self._arrivals.get(to_day(day), {}).values()
+                                if b.get_room() is not None}
+            for booking in list(self._departures.get(to_day(day), {}).values()):
+                room = booking.get_room()
+                if room is not None:
+                    yield day, room, booking, arrivals_by_room.get(room.get_room_number())
+    
+    def _discard(self, buckets, day, booking_id):
+        """Remove a booking from one bucket, dropping the bucket when empty"""
+        bucket = buckets.get(day)
+        if bucket is not None:
+            bucket.pop(booking_id, None)
+            if not bucket:
+                del buckets[day]
\ No newline at end of file
@@ -1,10 +1,11 @@
 # testing.py
 from person import Guest, Staff
 from room import Room, RoomType
-from service import Service
+from service import Service, PRIORITY_URGENT
 from booking import Booking
 from payment import Payment, Invoice
 from hotel import Hotel
+from money import format_cents
 
 # Constants for discounts and taxes
 LOYALTY_POINTS_PER_NIGHT = 10
@@ -86,15 +87,15 @@ royal_stay.add_service_to_booking(booking3._booking_id, "SRV002")  # Laundry aga
 
 # Process payments
 # Payment for booking1 (no discount)
-payment1 = royal_stay.process_payment(booking1._booking_id, booking1._total_cost, "Credit Card")
+payment1 = royal_stay.process_payment(booking1._booking_id, booking1.get_total_cost(), "Credit Card")
 
 # Payment for booking2 (loyalty discount)
 # Calculate discount (500 points * 0.05 = 25% discount)
-discounted_amount2 = booking2._total_cost * 0.75
+discounted_amount2 = booking2.get_total_cost() * 0.75
 payment2 = royal_stay.process_payment(booking2._booking_id, discounted_amount2, "Debit Card")
 
 # Payment for booking3 (bulk discount for long stay)
-discounted_amount3 = booking3._total_cost * 0.90  # 10% discount
+discounted_amount3 = booking3.get_total_cost() * 0.90  # 10% discount
 payment3 = royal_stay.process_payment(booking3._booking_id, discounted_amount3, "Cash")
 
 # Create service requests
@@ -151,4 +152,186 @@ print(f"Before cancellation - Room 101 available: {room101.is_available}")
 royal_stay.cancel_booking(booking1._booking_id)
 print(f"After cancellation - Room 101 available: {room101.is_available}")
 print(f"Booking 1 status: {booking1._status}")
-print(f"Payment 1 status: {payment1._status}")
\ No newline at end of file
+print(f"Payment 1 status: {payment1._status}")
+
+# Test guest lookup
+print("\n----- Guest Lookup -----")
+print(f"By email: {royal_stay.find_guest_by_email('MARIAM@email.com').get_name()}")
+print(f"By phone: {[g.get_name() for g in royal_stay.find_guests_by_contact('(555) 0101')]}")
+print(f"By name prefix 'ma': {[g.get_name() for g in royal_stay.find_guests_by_name('ma')]}")
+guest1.set_email("alyazia.saeed@email.com")
+print(f"After email change: {royal_stay.find_guest_by_email('alyazia.saeed@email.com').get_name()}")
+print(f"Duplicates: {[g.get_guest_id() for g in royal_stay.find_duplicate_guests('Mariam Abdulla', '555-0102', 'other@email.com')]}")
+
+# Test loyalty ledger
+print("\n----- Loyalty Points -----")
+print(f"Before accrual - {guest2.get_name()}: {guest2.get_loyalty_points()} points")
+accrued = royal_stay.run_loyalty_accrual(next_week + timedelta(days=5))
+print(f"Accrued points for {accrued} completed stays")
+print(f"After accrual - {guest2.get_name()}: {guest2.get_loyalty_points()} points")
+print(f"{guest1.get_name()} (cancelled stay): {guest1.get_loyalty_points()} points")
+guest2.redeem_loyalty_points(100)
+expired = royal_stay.run_loyalty_expiry(today + timedelta(days=800))
+print(f"Expired {expired} points, {guest2.get_name()} now has {guest2.get_loyalty_points()} points")
+for transaction in royal_stay.get_loyalty_history("G002"):
+    print(f"- {transaction['day']} {transaction['kind']}: {transaction['points']}")
+
+# A guest of two hotels that do not share a ledger keeps one points balance
+sister_hotel = Hotel("Royal Stay Suites")
+sister_hotel.add_room(Room("S1", single_type, ["Wi-Fi"], 89.99))
+sister_hotel.add_guest(guest2)
+sister_stay = sister_hotel.make_booking("G002", "S1", today, today + timedelta(days=2))
+points_before = guest2.get_loyalty_points()
+print(f"Accrued at {sister_hotel.get_name()}: {sister_hotel.run_loyalty_accrual(today + timedelta(days=2))} stay(s), "
+      f"{guest2.get_name()} {points_before} -> {guest2.get_loyalty_points()} points")
+print(f"Last transaction there: {sister_hotel.get_loyalty_history('G002')[-1]['kind']}")
+
+# Test service request dispatch
+print("\n----- Service Dispatch -----")
+request3 = royal_stay.create_service_request("G001", "SRV003", PRIORITY_URGENT)
+print(f"Pending at Front Desk: {[r.get_service().get_name() for r in royal_stay.get_pending_service_requests('Front Desk')]}")
+claimed = royal_stay.claim_service_request("S001")
+print(f"{staff1.get_name()} claimed: {claimed.get_service().get_name()}")
+royal_stay.fulfill_service_request(claimed.get_request_id())
+print(f"Metrics: {royal_stay.get_service_metrics()}")
+
+# Test arrivals, departures and turnovers
+print("\n----- Front Desk Lists -----")
+print(f"Arrivals tomorrow: {[b.get_guest().get_name() for b in royal_stay.get_arrivals(tomorrow)]}")
+print(f"In house tomorrow: {[b.get_room().get_room_number() for b in royal_stay.get_in_house(tomorrow)]}")
+print("Upcoming turnovers:")
+for day, room, departing, arriving in royal_stay.iter_turnovers(today, 14):
+    next_guest = arriving.get_guest().get_name() if arriving else "None"
+    print(f"- {day}: Room {room.get_room_number()} ({departing.get_guest().get_name()} out, next in: {next_guest})")
+
+# Test occupancy forecast
+print("\n----- Occupancy Forecast -----")
+forecast = royal_stay.forecast_occupancy(horizon=14)
+for type_name, series in forecast.items():
+    print(f"{type_name}: next 14 days occupancy {sum(series['occupancy']) / 14:.0%}, "
+          f"revenue ${sum(series['revenue']):.2f}")
+
+# Test waitlist
+print("\n----- Waitlist -----")
+busy_week = today + timedelta(days=20)
+booking4 = royal_stay.make_booking("G001", "101", busy_week, busy_week + timedelta(days=3))
+entry1 = royal_stay.add_to_waitlist("G002", busy_week + timedelta(days=1), busy_week + timedelta(days=3), "Single")
+entry2 = royal_stay.add_to_waitlist("G002", busy_week, busy_week + timedelta(days=2), priority=1)
+print(entry1)
+print(entry2)
+royal_stay.cancel_booking(booking4.get_booking_id())
+print(f"After cancelling booking 4: {entry1.get_status()}, {entry2.get_status()}")
+print(f"Room 101 booked from waitlist: {entry1.get_booking().get_check_in()} to {entry1.get_booking().get_check_out()}")
+
+# Test change events
+print("\n----- Change Events -----")
+import os
+import tempfile
+from events import JsonlEventSink, BOOKING_CREATED, BOOKING_CANCELLED
+event_log = os.path.join(tempfile.mkdtemp(), "events.jsonl")
+sink = JsonlEventSink(event_log, batch_size=10)
+royal_stay.subscribe(sink)
+royal_stay.subscribe(lambda event: print(event), [BOOKING_CREATED, BOOKING_CANCELLED])
+booking5 = royal_stay.make_booking("G001", "201", busy_week, busy_week + timedelta(days=1))
+royal_stay.add_service_to_booking(booking5.get_booking_id(), "SRV002")
+royal_stay.process_payment(booking5.get_booking_id(), booking5.get_total_cost(), "Cash")
+room201.set_price(159.99)
+laundry.set_availability(False)
+royal_stay.cancel_booking(booking5.get_booking_id())
+sink.flush()
+with open(event_log) as log:
+    print(f"Events written to log: {len(log.readlines())}")
+
+
+# Test revenue summary
+print("\n----- Revenue Summary -----")
+for name, cents in royal_stay.get_revenue_summary().items():
+    print(f"{name.replace('_', ' ').title()}: ${format_cents(cents)}")
+
+# Test guest profile store
+print("\n----- Guest Profile Store -----")
+store_path = os.path.join(tempfile.mkdtemp(), "guests")
+store_hotel = Hotel("Royal Stay Annex", store_path, guest_cache_size=2)
+store_hotel.add_room(Room("A1", single_type, ["Wi-Fi"], 89.99))
+for number in range(1, 6):
+    store_hotel.add_guest(Guest(f"Annex Guest {number}", f"555-10{number:02d}", f"annex{number}@email.com", f"A{number:03d}"))
+print(f"Guests: {len(store_hotel._guests)}, cached in memory: {store_hotel._guests.get_cached_count()}")
+store_hotel.make_booking("A001", "A1", tomorrow, tomorrow + timedelta(days=2))
+reloaded = store_hotel.find_guest_by_email("annex1@email.com")
+print(f"Reloaded {reloaded.get_name()} with {len(reloaded.get_reservation_history())} reservation(s)")
+reloaded.add_loyalty_points(50)
+store_hotel.close()
+reopened = Hotel("Royal Stay Annex", store_path, guest_cache_size=2)
+found = reopened.find_guest_by_email("annex1@email.com")
+print(f"After reopening: {found.get_name()} with {found.get_loyalty_points()} points, "
+      f"reservation IDs: {len(found.get_reservation_ids())}")
+reopened.close()
+
+# Test read snapshots
+print("\n----- Read Snapshots -----")
+snapshot = royal_stay.snapshot()
+booking6 = royal_stay.make_booking("G001", "301", busy_week, busy_week + timedelta(days=2))
+royal_stay.process_payment(booking6.get_booking_id(), booking6.get_total_cost(), "Credit Card")
+print(f"Bookings in snapshot: {len(list(snapshot.iter_bookings()))}, "
+      f"in a new snapshot: {len(list(royal_stay.snapshot().iter_bookings()))}")
+print(f"Booking 1 in snapshot: {snapshot.get_booking(booking1.get_booking_id()).status}")
+print(f"Room 301 calendar in snapshot: {len(snapshot.get_room('301').booked_dates)} stays, "
+      f"now: {len(royal_stay.snapshot().get_room('301').booked_dates)} stays")
+
+# Test workload simulator
+print("\n----- Workload Simulation -----")
+from simulator import WorkloadSimulator, build_hotel, format_report
+simulator = WorkloadSimulator(build_hotel(rooms=30, guests=100), seed=7, ops_per_day=100)
+print(format_report(simulator.run(days=7)))
+
+
+# Test type-level inventory
+print("\n----- Room Type Inventory -----")
+type_hotel = Hotel("Royal Stay Lodge")
+type_hotel.add_room_type(double_type)
+for number in ("L1", "L2"):
+    type_hotel.add_room(Room(number, double_type, ["Wi-Fi"], 129.99))
+type_hotel.add_guest(Guest("Lodge Guest", "555-2001", "lodge@email.com", "L001"))
+lodge_stay = (busy_week, busy_week + timedelta(days=3))
+type_booking = type_hotel.make_type_booking("L001", "Double", *lodge_stay)
+type_hotel.make_booking("L001", "L1", *lodge_stay)
+print(f"Doubles free: {type_hotel.get_type_availability(*lodge_stay)['Double']}, "
+      f"any left: {type_hotel.is_type_available('Double', *lodge_stay)}")
+try:
+    type_hotel.make_type_booking("L001", "Double", *lodge_stay)
+except ValueError as e:
+    print(f"Expected error: {e}")
+print(f"Before assignment: Room {type_booking.get_room_label()}")
+type_hotel.assign_rooms()
+print(f"After assignment: Room {type_booking.get_room_label()}, unassigned left: {len(type_hotel.get_unassigned_bookings())}")
+
+# Test room assignment optimizer
+print("\n----- Room Assignment Optimizer -----")
+for number in ("L3", "L4"):
+    type_hotel.add_room(Room(number, single_type, ["Wi-Fi"], 89.99))
+early = type_hotel.make_booking("L001", "L3", tomorrow, tomorrow + timedelta(days=2))
+late = type_hotel.make_booking("L001", "L4", tomorrow + timedelta(days=2), tomorrow + timedelta(days=4))
+result = type_hotel.optimize_room_assignments(horizon=30)["Single"]
+print(f"Moved {result['moved']} booking(s); free runs {result['before']['gaps']} -> {result['after']['gaps']}, "
+      f"longest {result['before']['longest_gap']} -> {result['after']['longest_gap']} nights")
+print(f"Rooms now: {early.get_room().get_room_number()}, {late.get_room().get_room_number()}")
+
+# Test night audit
+print("\n----- Night Audit -----")
+from night_audit import audit_chain
+first_night = type_hotel.run_night_audit(tomorrow)
+print(f"Night of {first_night['day']}: posted ${format_cents(first_night['room_charges_cents'])} "
+      f"to {len(first_night['posted'])} stay(s)")
+type_hotel.process_payment(early.get_booking_id(), 50.00, "Cash")
+chain = audit_chain([royal_stay, type_hotel], tomorrow + timedelta(days=2))
+print(f"Chain audit: posted ${format_cents(chain['room_charges_cents'] + chain['service_charges_cents'])}, "
+      f"completed {chain['completed']} stay(s), {chain['mismatches']} mismatch(es)")
+for booking, total, paid in chain["hotels"]["Royal Stay Lodge"]["mismatches"]:
+    print(f"Booking {booking.get_booking_id()} ({booking.get_status()}): "
+          f"total ${format_cents(total)}, paid ${format_cents(paid)}")
+try:
+    type_hotel.run_night_audit(tomorrow)
+except ValueError as e:
+    print(f"Expected error: {e}")
+rerun = audit_chain([royal_stay, type_hotel], tomorrow + timedelta(days=2))
+print(f"Chain audit rerun: audited {len(rerun['hotels'])} hotel(s), errors: {rerun['errors']}")
\ No newline at end of file
@@ -0,0 +1,186 @@
+import itertools
+from collections import Counter
+from bisect import bisect_left, insort
+from days import to_day
+
+
+class WaitlistEntry:
+    """Class representing a guest waiting for a date range to free up"""
+    
+    def __init__(self, entry_id, guest_id, check_in, check_out, room_type=None, priority=0):
+        """
+        Initialize a WaitlistEntry object
+        
+        Args:
+            entry_id: Unique entry identifier
+            guest_id: ID of the waiting guest
+            check_in: Requested check-in date
+            check_out: Requested check-out date
+            room_type: Requested room type name, or None for any type
+            priority: Lower numbers are served first
+        """
+        self._entry_id = entry_id
+        self._guest_id = guest_id
+        self._check_in = check_in
+        self._check_out = check_out
+        self._room_type = room_type
+        self._priority = priority
+        self._status = "Waiting"
+        self._booking = None
+    
+    def get_entry_id(self):
+        """Get the entry ID"""
+        return self._entry_id
+    
+    def get_guest_id(self):
+        """Get the waiting guest's ID"""
+        return self._guest_id
+    
+    def get_check_in(self):
+        """Get the requested check-in date"""
+        return self._check_in
+    
+    def get_check_out(self):
+        """Get the requested check-out date"""
+        return self._check_out
+    
+    def get_room_type(self):
+        """Get the requested room type name (None for any type)"""
+        return self._room_type
+    
+    def get_priority(self):
+        """Get the entry priority"""
+        return self._priority
+    
+    def get_status(self):
+        """Get the entry status"""
+        return self._status
+    
+    def get_booking(self):
+        """Get the booking made for the entry, if any"""
+        return self._booking
+    
+    def mark_booked(self, booking):
+        """Record the booking that satisfied the entry"""
+        self._booking = booking
+        self._status = "Booked"
+    
+    def cancel(self):
+        """Withdraw the entry from the waitlist"""
+        self._status = "Cancelled"
+    
+    def __str__(self):
+        """String representation of the WaitlistEntry"""
+        return (f"Waitlist {self._entry_id}: Guest {self._guest_id}, "
+                f"{self._room_type or 'Any'} room, {self._check_in} to {self._check_out} "
+                f"(Priority: {self._priority}, Status: {self._status})")
+
+
+class Waitlist:
+    """Interval index of waitlist entries by room type and requested dates"""
+    
+    def __init__(self):
+        """Initialize an empty Waitlist"""
+        self._entries = {}
+        # Per room type: sorted (check-in ordinal, sequence, entry ID) plus the
+        # longest stay, which bounds how early a candidate can start; stay
+        # lengths are counted so the longest shrinks back when it leaves
+        self._starts = {}
+        self._max_nights = {}
+        self._night_counts = {}
+        self._sequence = itertools.count(1)
+    
+    def add(self, guest_id, check_in, check_out, room_type=None, priority=0):
+        """
+        Add a request to the waitlist
+        
+        Args:
+            guest_id: ID of the waiting guest
+            check_in: Requested check-in date
+            check_out: Requested check-out date
+            room_type: Requested room type name, or None for any type
+            priority: Lower numbers are served first
+        
+        Returns:
+            WaitlistEntry: The new entry
+        """
+        if check_in >= check_out:
+            raise ValueError("Check-in date must be before check-out date")
+        sequence = next(self._sequence)
+        entry = WaitlistEntry(f"WL-{sequence:06d}", guest_id, check_in, check_out,
+                              room_type, priority)
+        key = room_type.lower() if room_type else None
+        self._entries[entry.get_entry_id()] = (sequence, entry)
+        insort(self._starts.setdefault(key, []),
+               (to_day(check_in), sequence, entry.get_entry_id()))
+        nights = to_day(check_out) - to_day(check_in)
+        self._night_counts.setdefault(key, Counter())[nights] += 1
+        self._max_nights[key] = max(self._max_nights.get(key, 0), nights)
+        return entry
+    
+    def get_entry(self, entry_id):
+        """Get an entry by ID"""
+        item = self._entries.get(entry_id)
+        return item[1] if item else None
+    
+    def remove(self, entry_id):
+        """Take an entry out of the index (after it was booked or cancelled)"""
+        item = self._entries.pop(entry_id, None)
+        if item is None:
+            return
+        sequence, entry = item
+        key = entry.get_room_type().lower() if entry.get_room_type() else None
+        starts = self._starts[key]
+        position = bisect_left(starts, (to_day(entry.get_check_in()), sequence, entry_id))
+        if position < len(starts) and starts[position][2] == entry_id:
+            del starts[position]
+        
+        nights = to_day(entry.get_check_out()) - to_day(entry.get_check_in())
+        counts = self._night_counts[key]
+        counts[nights] -= 1
+        if not counts[nights]:
+            del counts[nights]
+            if nights == self._max_nights[key]:
+                self._max_nights[key] = max(counts, default=0)
+    
+    def find_candidates(self, room_type, freed_in, freed_out, window_start=None, window_end=None):
+        """
+        Find entries that fit into a room freed for a date range, best priority first
+        
+        Only entries overlapping the freed range can have been blocked by it,
+        and none starts more than the longest stay before it, so
+        each room type bucket is searched over a narrow range of check-ins.
+        
+        Args:
+            room_type: Type name of the freed room
+            freed_in: Start of the freed range
+            freed_out: End of the freed range
+            window_start: Start of the room's free gap (None if unbounded)
+            window_end: End of the room's free gap (None if unbounded)
+        
+        Returns:
+            List[WaitlistEntry]: Candidate entries in priority order
+        """
+        low_bound = to_day(window_start) if window_start else None
+        high_bound = to_day(window_end) if window_end else None
+        found = []
+        for key in (room_type.lower(), None):
+            starts = self._starts.get(key)
+            if not starts:
+                continue
+            low = to_day(freed_in) - self._max_nights[key] + 1
+            if low_bound is not None:
+                low = max(low, low_bound)
+            position = bisect_left(starts, (low,))
+            end = bisect_left(starts, (to_day(freed_out),))
+            for _, sequence, entry_id in starts[position:end]:
+                entry = self._entries[entry_id][1]
+                check_out = to_day(entry.get_check_out())
+                if check_out > to_day(freed_in) and (high_bound is None or check_out <= high_bound):
+                    found.append((entry.get_priority(), sequence, entry))
+        found.sort(key=lambda item: item[:2])
+        return [entry for _, _, entry in found]
+    
+    def __len__(self):
+        """Number of entries still waiting"""
+        return len(self._entries)
\ No newline at end of file